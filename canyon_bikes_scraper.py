@@ -5,38 +5,599 @@ Scrapes Canyon road bikes from the Dutch website with intelligent predictions
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 import json
 import csv
-import pandas as pd
 import re
 import logging
-from datetime import datetime
+import argparse
+from datetime import datetime, timedelta
 import time
+import threading
 import os
 import shutil
 from urllib.parse import urljoin, urlparse
-import glob
-from collections import defaultdict
+import fnmatch
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 
-# Import WordPress converter
+# WordPress converter; it pulls in pandas, so like pandas it is only imported in save_data
+WORDPRESS_CONVERTER_AVAILABLE = importlib.util.find_spec('wordpress_csv_converter') is not None
+
+# Write the Excel export with the faster xlsxwriter engine when it is installed
+EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') is not None else 'openpyxl'
+
+# Also export Parquet when pyarrow is installed
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Optional on-disk HTTP cache for repeated development runs
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional faster decoder for the dataLayer JSON and encoder for the exports; orjson's
+# decode errors subclass json.JSONDecodeError, so the existing handlers cover both
 try:
-    from wordpress_csv_converter import convert_latest_to_wordpress
-    WORDPRESS_CONVERTER_AVAILABLE = True
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(data):
+        """Encode data as indented UTF-8 JSON bytes"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 except ImportError:
-    WORDPRESS_CONVERTER_AVAILABLE = False
+    json_loads = json.loads
+
+    def json_dumps(data):
+        """Encode data as indented UTF-8 JSON bytes"""
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+# Prefer the C-based lxml parser, fall back to the built-in parser if it is missing
+try:
+    BeautifulSoup('', 'lxml')
+    HTML_PARSER = 'lxml'
+except FeatureNotFound:
+    HTML_PARSER = 'html.parser'
+
+# Color variant words that need more than plain capitalization
+_SPECIAL_COLOR_NAMES = {
+    'reddark': 'Red Dark',
+    'bluedark': 'Blue Dark',
+    'greydark': 'Grey Dark',
+    'greendark': 'Green Dark',
+    'tealdark': 'Teal Dark',
+    'bluelight': 'Blue Light',
+    'greenlight': 'Green Light',
+    'greylight': 'Grey Light',
+}
+
+# Patterns used for every scraped page, compiled once at import time
+_SCRIPT_TAG_RE = re.compile(r'^script')
+_IMPRESSIONS_RE = re.compile(r'"impressions"\s*:\s*(\[.*?\])', re.DOTALL)
+_ECOMMERCE_ITEMS_RE = re.compile(r'ecommerce["\']?\s*:\s*{[^}]*items["\']?\s*:\s*(\[.*?\])', re.DOTALL)
+_COLOR_ARRAY_RE = re.compile(r'"name"\s*:\s*"([^"]+)".*?"color"\s*:\s*\[\s*((?:"[^"]*"(?:\s*,\s*)?)+)\s*\]', re.DOTALL)
+_COLOR_ENTITY_ARRAY_RE = re.compile(r'"name"\s*:\s*"([^"]+)".*?&#034;color&#034;\s*:\s*\[\s*((?:&#034;[^&]*&#034;(?:\s*,\s*)?)+)\s*\]', re.DOTALL)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_ENTITY_QUOTED_RE = re.compile(r'&#034;([^&]*)&#034;')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Canyon detail page price, weight and gear count patterns
+_PRICE_TEXT_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'(\d+\.?\d*)\s*€',  # "1.849 €"
+    r'€\s*(\d+\.?\d*)',  # "€ 1849"
+    r'(\d+,\d+)\s*€',    # "1,849 €"
+    r'€\s*(\d+,\d+)',    # "€ 1,849"
+])
+_PRICE_DIGITS_RE = re.compile(r'[\d.,]+')
+_PAGE_WEIGHT_RE = re.compile(r'(\d+[,.]?\d*)\s*kg')
+_PAGE_SPEED_RE = re.compile(r'(\d+)\s*(?:speed|versnellingen|Speed)')
+# Boilerplate paragraphs that are never a bike description (matched on lowercased text)
+_SKIP_DESCRIPTION_RE = re.compile(r'cookie|privacy|newsletter|copyright|terms|conditions')
+_WEIGHT_LIMIT_KG_RE = re.compile(r'(\d+)\s*kg')
+
+# Canyon onderdelen (components) section: frame material feature and the speed
+# suffixes stripped from shifter names, applied in order
+_FRAME_MATERIAL_FEATURE_RE = re.compile(r'materiaal:\s*([^.]+)', re.IGNORECASE)
+_ONDERDELEN_SHIFTER_SPEED_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r',\s*\d+[-\s]*speed\b',  # ", 12-speed"
+    r',\s*\d+s\b',            # ", 12s"
+    r'\b\d+[-\s]*speed\b',     # "12 speed"
+    r'\b\d+s\b',               # "12s"
+])
+
+# Onderdelen component titles mapped to our specification fields. The first
+# pattern (in this order) contained in a component title wins.
+_ONDERDELEN_TITLE_TO_FIELD = {
+    'schakel / remhendel': 'Shifter',
+    'voorderailleur': 'Voorderailleur',
+    'achterderailleur': 'Achterderailleur',
+    'crankstel': 'Crankstel',
+    'trapas': 'Bottom_bracket',
+    'bottom bracket': 'Bottom_bracket',
+    'cassette': 'Cassette',
+    'ketting': 'Ketting',
+    'chain': 'Ketting',
+    'pedaal': 'Pedaal',
+    'pedalen': 'Pedaal',
+    'kettingblad': 'Maximale_maat_kettingblad',
+    'chainring': 'Maximale_maat_kettingblad',
+    'wiel': 'Wiel',  # We'll handle wheel components specially
+    'wheel': 'Wiel',
+    'steekas': 'Steekas',  # We'll handle axle components specially
+    'through axle': 'Steekas',
+    'voornaaf': 'Naaf_voor',
+    'naaf voor': 'Naaf_voor',
+    'front hub': 'Naaf_voor',
+    'vooras': 'As_voorwiel',
+    'as voorwiel': 'As_voorwiel',
+    'front axle': 'As_voorwiel',
+    'achternaaf': 'Naaf_achter',
+    'naaf achter': 'Naaf_achter',
+    'rear hub': 'Naaf_achter',
+    'velg': 'Velg',
+    'velgen': 'Velg',
+    'rim': 'Velg',
+    'band': 'Buitenband',
+    'buitenband': 'Buitenband',
+    'tire': 'Buitenband',
+    'tyre': 'Buitenband',
+    'zadel': 'Zadel',
+    'saddle': 'Zadel',
+    'zadelpen': 'Zadelpen',
+    'seatpost': 'Zadelpen',
+    'stuur': 'Stuur',
+    'cockpit': 'Stuur',
+    'handlebar': 'Stuur',
+    'handlebars': 'Stuur',
+    'stuurlint': 'Stuurlint',
+    'bar tape': 'Stuurlint',
+    'tape': 'Stuurlint',
+    'stuurpen': 'Stuurpen',
+    'stem': 'Stuurpen',
+    'balhoofdstel': 'Balhoofdstel',
+    'headset': 'Balhoofdstel',
+    'rem': 'Rem',
+    'remmen': 'Rem',
+    'brake': 'Rem',
+    'brakes': 'Rem',
+    'frame': 'Frame',
+    'kader': 'Frame'
+}
+
+# Only the component items of the onderdelen fragment are read, so skip building the rest
+_ONDERDELEN_STRAINER = SoupStrainer('li', class_='allComponents__sectionSpecListItem')
+
+# Numeric part of a summary price once "€" and thousands dots are removed
+_SUMMARY_PRICE_RE = re.compile(r'[\d,]+')
+
+# CSS selectors tried in order on every detail page
+_DESCRIPTION_SELECTORS = (
+    'div[data-testid="product-positioning-statement"]',
+    '.product-positioning-statement',
+    '.product-description',
+    '.product-summary',
+    'div.product-details p',
+    'div.product-info p'
+)
+_CANYON_NAME_SELECTORS = (
+    'h1',
+    '.pdpDetailHero h1',
+    '.productDetailHero__productTitle',
+    'h1[class*="productTitle"]',
+    'h1[class*="product-title"]',
+    '.product-name h1'
+)
+_CANYON_PRICE_SELECTORS = (
+    '.price',
+    '.pdpDetailHero .price',
+    '.price-current',
+    '.price__current',
+    '[class*="price"]'
+)
+_CANYON_SPEC_ROW_SELECTORS = (
+    'table tr', '.spec-table tr', '.specifications tr',
+    '.component-table tr', '.tech-specs tr', '.bike-specs tr',
+    '[class*="spec"] tr', '[class*="component"] tr',
+    '.product-specs tr', '.details-table tr'
+)
+_CANYON_DESCRIPTION_SELECTORS = (
+    '.pdpDetailHero p',
+    '.product-description',
+    '.product-positioning',
+    '.bike-description',
+    '.description p',
+    '[class*="description"] p',
+    '.product-details p',
+    '.productDetailContent p',
+    '.hero-description p'
+)
+_CANYON_IMAGE_SELECTORS = (
+    'img[src*="canyon"]',
+    'img[data-src*="canyon"]',
+    'img[src*="dma.canyon.com"]',
+    'img[data-src*="dma.canyon.com"]',
+    '.productDetailHero img',
+    '.productCarousel img',
+    '.gallery img'
+)
+
+# Specification mapping from various Dutch/English terms to our standard names;
+# the first term found in a table or list key wins, so the order matters
+_CANYON_SPEC_MAPPING = {
+    # Frame specifications
+    'frame': 'Frame', 'kader': 'Frame', 'frameset': 'Frame',
+    'framefit': 'Framefit', 'frame fit': 'Framefit',
+    'gewicht': 'Gewicht', 'weight': 'Weight', 'massa': 'Gewicht',
+    'gewichtslimiet': 'Gewichtslimiet', 'weight limit': 'Gewichtslimiet',
+    'maximum weight': 'Gewichtslimiet', 'max gewicht': 'Gewichtslimiet',
+
+    # Drivetrain
+    'shifter': 'Shifter', 'schakelhendel': 'Shifter', 'schakelaar': 'Shifter',
+    'voorderailleur': 'Voorderailleur', 'front derailleur': 'Voorderailleur',
+    'achterderailleur': 'Achterderailleur', 'rear derailleur': 'Achterderailleur',
+    'derailleur achter': 'Achterderailleur', 'derailleur voor': 'Voorderailleur',
+    'crankstel': 'Crankstel', 'crankset': 'Crankstel', 'crank': 'Crankstel',
+    'bottom bracket': 'Bottom_bracket', 'trapas': 'Bottom_bracket',
+    'cassette': 'Cassette', 'tandwielcassette': 'Cassette',
+    'ketting': 'Ketting', 'chain': 'Ketting',
+    'pedaal': 'Pedaal', 'pedal': 'Pedaal', 'pedalen': 'Pedaal',
+    'kettingblad': 'Maximale_maat_kettingblad', 'chainring': 'Maximale_maat_kettingblad',
+
+    # Wheels & Tires
+    'naaf voor': 'Naaf_voor', 'front hub': 'Naaf_voor', 'voornaaf': 'Naaf_voor',
+    'as voorwiel': 'As_voorwiel', 'front axle': 'As_voorwiel', 'vooras': 'As_voorwiel',
+    'naaf achter': 'Naaf_achter', 'rear hub': 'Naaf_achter', 'achternaaf': 'Naaf_achter',
+    'velg': 'Velg', 'rim': 'Velg', 'velgen': 'Velg',
+    'buitenband': 'Buitenband', 'tire': 'Buitenband', 'band': 'Buitenband',
+    'bandenmaaat': 'Maximale_bandenmaat', 'tire size': 'Maximale_bandenmaat',
+    'max tire': 'Maximale_bandenmaat', 'max band': 'Maximale_bandenmaat',
+
+    # Cockpit
+    'zadel': 'Zadel', 'saddle': 'Zadel', 'zitting': 'Zadel',
+    'zadelpen': 'Zadelpen', 'seatpost': 'Zadelpen', 'zadelstam': 'Zadelpen',
+    'stuur': 'Stuur', 'handlebar': 'Stuur', 'handlebars': 'Stuur',
+    'stuurlint': 'Stuurlint', 'bar tape': 'Stuurlint', 'tape': 'Stuurlint',
+    'stuurpen': 'Stuurpen', 'stem': 'Stuurpen', 'voorstam': 'Stuurpen',
+    'balhoofdstel': 'Balhoofdstel', 'headset': 'Balhoofdstel',
+
+    # Brakes & Other
+    'rem': 'Rem', 'brake': 'Rem', 'remmen': 'Rem', 'brakes': 'Rem',
+    'speed': 'Shifter_speed', 'versnellingen': 'Shifter_speed',
+    'aantal versnellingen': 'Shifter_speed',
+
+    # Material
+    'material': 'Material', 'materiaal': 'Material'
+}
+
+# Specification columns written for every CSV/Excel row, in this order
+_CSV_SPEC_COLUMNS = (
+    'Frame', 'Framefit', 'Gewicht', 'Gewichtslimiet', 'Shifter',
+    'Voorderailleur', 'Achterderailleur', 'Crankstel', 'Bottom_bracket',
+    'Cassette', 'Ketting', 'Pedaal', 'Maximale_maat_kettingblad',
+    'Naaf_voor', 'As_voorwiel', 'Naaf_achter', 'Velg', 'Buitenband',
+    'Maximale_bandenmaat', 'Zadel', 'Zadelpen', 'Stuur', 'Stuurlint',
+    'Stuurpen', 'Balhoofdstel', 'Rem', 'Shifter_speed'
+)
+
+_FORK_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'carbon voorvork[^.]*',
+    r'voorvork[^.]*carbon[^.]*',
+    r'fork[^.]*carbon[^.]*',
+    r'carbon fork[^.]*'
+])
+_FORK_KEYWORD_RE = re.compile(r'fork|vork', re.IGNORECASE)
+
+_BOTTOM_BRACKET_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'((?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*?(?:T47|BSA|PressFit)[^.]*)',
+    r'((?:T47|BSA|PressFit)[^.]*?(?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*)',
+    r'(Bottom bracket[^.]*(?:SRAM|Praxis|Shimano)[^.]*)',
+    r'((?:SRAM|Praxis|Shimano)[^.]*bottom bracket[^.]*)'
+])
+_BOTTOM_BRACKET_KEYWORD_RES = (
+    re.compile(r'sram|praxis|shimano', re.IGNORECASE),
+    re.compile(r'bottom bracket|t47|bsa|pressfit', re.IGNORECASE)
+)
+
+_CHAIN_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'((?:SRAM|Shimano|KMC)\s+(?:PC-\d+|HG\d+|CN\d+|XT M\d+|Ultegra|105)[^.]*?(?:\d+-)?\d+-speed)',
+    r'((?:SRAM|Shimano|KMC)\s+[^.]*?(?:\d+-)?\d+-speed[^.]*chain)',
+    r'(chain[^.]*(?:SRAM|Shimano|KMC)[^.]*(?:\d+-)?\d+-speed)',
+    r'((?:\d+-)?\d+-speed[^.]*(?:SRAM|Shimano|KMC)[^.]*chain)'
+])
+_CHAIN_KEYWORD_RES = (
+    re.compile(r'sram|shimano|kmc', re.IGNORECASE),
+    re.compile(r'\d-speed', re.IGNORECASE)
+)
+
+# Gear counts on the onderdelen page, tried in order
+_SPEED_COUNT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(\d+)[-\s]*speed',
+    r'(\d+)[-\s]*versnellingen'
+])
+
+# Weight limits like "125 kg", "150 kg", etc.
+_WEIGHT_LIMIT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(\d+(?:[.,]\d+)?\s*kg)',
+    r'(\d+(?:[.,]\d+)?\s*lbs?)',
+])
+
+# Matches "8.43 kg / 18.59 lbs" and captures just "8.43 kg"
+_KG_RE = re.compile(r'(\d+(?:[.,]\d+)?\s*kg)(?:\s*/\s*\d+(?:[.,]\d+)?\s*lbs)?', re.IGNORECASE)
+_KG_LBS_RE = re.compile(r'\d+(?:[.,]\d+)?\s*kg\s*/\s*\d+(?:[.,]\d+)?\s*lbs', re.IGNORECASE)
+
+# Numeric frame sizes without cm (like "56 -" but not "56 cm -", "ML -" or "M -")
+_NUMERIC_SIZE_WEIGHT_RE = re.compile(r'(\d+)\s*-\s*(\d+(?:[.,]\d+)?\s*kg)')
+
+# Frame size information at the start of a shifter spec, either numeric sizes
+# ("Maat: 47, 50, 52 ") or letter sizes ("Maat: XS, S, M, ML, L, XL ")
+_SHIFTER_SIZE_RE = re.compile(r'^Maat:\s*(?:\d+(?:\s*,\s*\d+)*|[A-Z]+(?:\s*,\s*[A-Z]+)*)\s+', re.IGNORECASE)
+
+_SHIFTER_SPEED_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(\d+)\s*speed',           # "8 speed", "10 Speed"
+    r'(\d+)-speed',             # "9-speed", "11-speed"
+    r'(\d+)\s*versnellingen',   # "10 versnellingen"
+])
+
+# Speed information inside a shifter spec: ", 8 speed,", "11-speed", ", 10 versnellingen,"
+_SHIFTER_SPEED_REMOVAL_RE = re.compile(r',?\s*\d+(?:\s*speed|-speed|\s*versnellingen)\s*,?', re.IGNORECASE)
+_DOUBLE_COMMA_RE = re.compile(r',\s*,')
+
+_FRAME_MATERIAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    # OCLV Carbon patterns
+    r'(\d+\s+[Ss]eries\s+OCLV\s+Carbon)',
+    r'(OCLV\s+Carbon\s+\d+)',
+    r'(OCLV\s+Carbon)',
+    # Alpha Aluminium patterns
+    r'(Ultralicht\s+\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
+    r'(\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
+    r'(Alpha\s+Aluminium\s+\d+)',
+    r'(Alpha\s+Aluminium)',
+    # Other materials
+    r'(Carbon\s+fiber)',
+    r'(Steel)',
+    r'(Titanium)',
+    r'(Chromoly)',
+])
+_FRAME_PREFIX_RE = re.compile(r'^(Frame[:\s]*)', re.IGNORECASE)
+
+# Framefit predictions by series name, then by category; earlier entries win when
+# a name mentions more than one
+_FRAMEFIT_BY_SERIES = {
+    'domane': 'Endurance',
+    'checkpoint': 'Endurance',
+    'madone': 'H1.5 Race',
+    'émonda': 'H1.5 Race',
+    'speed concept': 'Triatlon',
+    'boone': 'H1.5 Race',
+    'fx': 'Comfort',
+}
+_FRAMEFIT_BY_CATEGORY = {
+    'performance': 'H1.5 Race',
+    'gravel': 'Endurance',
+    'cyclocross': 'Endurance',
+    'fitness': 'Comfort',
+    'triathlon': 'Triatlon',
+}
+_FRAMEFIT_SERIES_RE = re.compile('|'.join(re.escape(series) for series in _FRAMEFIT_BY_SERIES))
+_FRAMEFIT_CATEGORY_RE = re.compile('|'.join(re.escape(category) for category in _FRAMEFIT_BY_CATEGORY))
+_FRAMEFIT_PRIORITY = {key: i for i, key in enumerate([*_FRAMEFIT_BY_SERIES, *_FRAMEFIT_BY_CATEGORY])}
+
+# Series and levels used to predict the bottom bracket from a (lower-cased) bike name
+_BB_DUB_SERIES_RE = re.compile(r'slr|sl [6789]')
+_BB_DUB_WIDE_LEVEL_RE = re.compile(r'alr|sl')
+_BB_PRAXIS_SERIES_RE = re.compile(r'domane|émonda|madone')
+_BB_SHIMANO_SERIES_RE = re.compile(r'fx|al [245]')
+
+# Chain predictions by rear derailleur brand, then groupset (first match wins). Each
+# entry is (groupset keywords, cassette hint, chain when the cassette contains the
+# hint, chain otherwise); an empty hint always matches
+_CHAIN_BY_GROUPSET = {
+    'sram': (
+        (('apex',), '12', 'SRAM Apex, 12-speed', 'SRAM PC-1130, 11-speed'),
+        (('rival',), '13', 'SRAM Rival, 13-speed', 'SRAM Rival, 12-speed'),
+        (('force',), '13', 'SRAM Force E1, 12/13-speed', 'SRAM Force, 12-speed'),
+        (('red',), '', 'SRAM RED D1, 12-speed', None),
+    ),
+    'shimano': (
+        (('ultegra', 'xt'), '', 'Shimano XT M8100, 12-speed', None),
+        (('105',), '', 'Shimano SLX M7100, 12-speed', None),
+        (('cues',), '', 'Shimano CN-LG500, 10-speed', None),
+    ),
+}
+# Generic fallback based on the cassette speed, tried in order
+_CHAIN_BY_CASSETTE_SPEED = (
+    ('11', 'SRAM PC-1130, 11-speed'),
+    ('12', 'Shimano SLX M7100, 12-speed'),
+    ('10', 'Shimano CN-LG500, 10-speed'),
+)
+
+_TEETH_RANGE_RE = re.compile(r'(\d+)-(\d+)')
+
+# Double chainring patterns like "50/34", "52/36", "48/35" and "46x30" (Trek uses this format!)
+_DOUBLE_CHAINRING_RE = re.compile(r'\d+[/x]\d+', re.IGNORECASE)
+
+# Each list below is joined into one alternation, so a single scan tests all of them
+_SINGLE_CHAINRING_RE = re.compile('|'.join([
+    r'\b40t\b.*ring',           # "40T ring"
+    r'\b42t\b.*ring',           # "42T ring"
+    r'\b40t\b.*kettingblad',    # "40T kettingblad"
+    r'\b42t\b.*kettingblad',    # "42T kettingblad"
+    r'narrow-wide.*kettingblad', # "narrow-wide kettingblad"
+    r'apex 1',                  # "SRAM Apex 1"
+    r'force.*1',                # "SRAM Force 1"
+    r'single.*chainring',       # "single chainring"
+]), re.IGNORECASE)
+_CHAINRING_TEETH_RE = re.compile(r'\b(\d+)t\b', re.IGNORECASE)
+
+# Wide range cassettes typical of 1x systems
+_WIDE_RANGE_CASSETTE_RE = re.compile('|'.join([
+    r'10-50', r'10-52', r'11-50', r'11-52',  # Very wide ranges
+    r'10-44', r'10-46', r'11-44', r'11-46',  # Wide ranges
+    r'10-48', r'11-48',                      # Common 1x ranges
+    r'10-42', r'11-42',                      # Moderate 1x ranges
+]), re.IGNORECASE)
+
+# 1x-specific rear derailleurs
+_ONEX_REAR_DERAILLEUR_RE = re.compile('|'.join([
+    r'apex 1',              # "SRAM Apex 1"
+    r'apex.*xplr',          # "SRAM Apex XPLR"
+    r'force.*xplr',         # "SRAM Force XPLR"
+    r'red.*xplr',           # "SRAM RED XPLR"
+    r'rival.*xplr',         # "SRAM Rival XPLR"
+    r'grx.*1x',             # "Shimano GRX 1x"
+    r'cues.*gs',            # "Shimano CUES GS" (often 1x)
+]), re.IGNORECASE)
+
+# Gravel and some fitness bikes often use 1x
+_ONEX_CATEGORY_RE = re.compile('|'.join([
+    'checkpoint.*alr.*[345]',   # Checkpoint ALR 3, 4, 5 often 1x
+    'fx.*sport',                # FX Sport bikes often 1x
+    'checkmate',                # Checkmate is typically 1x
+    'boone.*5',                 # Boone 5 often 1x
+]), re.IGNORECASE)
+
+# Comprehensive patterns to find all carousel images
+_HERO_IMAGE_PATTERNS = tuple(re.compile(pattern, re.DOTALL) for pattern in [
+    # Enhanced structured data patterns
+    r'"heroCarousel"\s*:\s*\[([^\]]+)\]',
+    r'"productImages"\s*:\s*\[([^\]]+)\]',
+    r'"imageGallery"\s*:\s*\[([^\]]+)\]',
+    r'"gallery"\s*:\s*\[([^\]]+)\]',
+    r'"images"\s*:\s*\[([^\]]+)\]',
+    r'"slides"\s*:\s*\[([^\]]+)\]',
+    r'"carouselSlides"\s*:\s*\[([^\]]+)\]',
+
+    # Color variant specific patterns
+    r'"colorSwatchImageUrl"\s*:\s*\[([^\]]+)\]',
+    r'"variantImages"\s*:\s*\[([^\]]+)\]',
+    r'"colorVariants"\s*:\s*\[([^\]]+)\]',
+
+    # Individual image patterns
+    r'"heroImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"primaryImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"firstVariantImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"thumbnailImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+
+    # URL patterns with various prefixes
+    r'"[a-zA-Z_]*[Uu]rl"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"[a-zA-Z_]*[Ii]mage[a-zA-Z_]*"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+
+    # Enhanced alternative image arrays
+    r'"primaryImages"\s*:\s*\[([^\]]+)\]',
+    r'"galleryImages"\s*:\s*\[([^\]]+)\]',
+    r'"productGallery"\s*:\s*\[([^\]]+)\]',
+    r'"heroImages"\s*:\s*\[([^\]]+)\]',
+])
+# The passes in extract_hero_carousel_images take the list above in these fixed slices
+_HERO_ARRAY_PATTERNS = _HERO_IMAGE_PATTERNS[:13]
+_HERO_SINGLE_PATTERNS = _HERO_IMAGE_PATTERNS[13:16]
+_HERO_URL_PATTERNS = _HERO_IMAGE_PATTERNS[16:18]
+_HERO_ALT_ARRAY_PATTERNS = _HERO_IMAGE_PATTERNS[18:]
+_QUOTED_TREK_MEDIA_URL_RE = re.compile(r'"([^"]*media\.trekbikes\.com[^"]*)"')
+_TREK_MEDIA_URL_RE = re.compile(r'([^"]*media\.trekbikes\.com[^"]*)')
+_UPLOAD_TRANSFORM_RE = re.compile(r'/image/upload/[^/]+/')
+
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-_\.]')
+_UNSAFE_FOLDER_CHARS_RE = re.compile(r'[^\w\-_\s]')
+
+# Product pages end in a numeric ID: ".../aeroad-cfr-di2/4039.html"
+_PRODUCT_ID_RE = re.compile(r'(?:^|/)\d{4,}[.html]*$')
+# Blog content and promotional pages
+_EXCLUDED_BIKE_URL_RE = re.compile('|'.join(re.escape(pattern) for pattern in [
+    '/blog-content/',
+    '/koopgids-',
+    '/wielren-blog',
+    '/news/',
+    '/stories/',
+    '/campaign/',
+    '/promo/',
+    '/service/',
+    '/support/',
+]))
+
+# Classes of elements near a listing link that may hold the bike name
+_NAME_CLASS_RE = re.compile(r'title|name|product', re.IGNORECASE)
+
+# Road bike series pages on the Canyon main page
+_SERIES_PAGE_HREFS = frozenset([
+    '/nl-nl/racefietsen/endurance-racefietsen/',
+    '/nl-nl/racefietsen/wielrenfietsen/',
+    '/nl-nl/racefietsen/aero-racefietsen/',
+])
+_SERIES_LINK_SELECTORS = (
+    'a[href*="endurance"]',
+    'a[href*="ultimate"]',
+    'a[href*="aeroad"]',
+    'a[href*="speedmax"]',
+    'a[href*="inflite"]',
+)
+
+# Hero image quality markers: thumbnails and placeholders to skip (size and type markers
+# in any case), then high and medium quality transformations
+_HERO_SKIP_RE = re.compile(r'(?i:thumb|icon|logo|badge|w_50|w_100|w_150|h_50|h_100)|default-no-image|CyclingTips')
+_HERO_HIGH_QUALITY_RE = re.compile(r'w_1360|w_1200|w_690|w_800|w_1000|Primary|Hero|Detail|Gallery|Portrait|h_1020|h_800|h_600')
+_HERO_MEDIUM_QUALITY_RE = re.compile(r'w_400|w_500|w_600|h_300|h_400|h_518')
+
+class RateLimiter:
+    """Token bucket shared by the worker threads: allows bursts of `burst` requests
+    and `rate` requests per second on average"""
+    def __init__(self, rate, burst):
+        self.interval = 1.0 / rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping only when the bucket is empty"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+            self.updated = now
+            # Reserve the token now so waiting threads queue up in order
+            self.tokens -= 1
+            wait = -self.tokens * self.interval
+        if wait > 0:
+            time.sleep(wait)
 
 class CanyonBikeScraper:
-    def __init__(self):
+    def __init__(self, use_cache=False):
         self.base_url = "https://www.canyon.com"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'nl-NL,nl;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
         }
-        self.session = requests.Session()
+        if use_cache and REQUESTS_CACHE_AVAILABLE:
+            # Serve repeat GETs from a local SQLite cache; once an entry expires it is
+            # revalidated with ETag/Last-Modified, and kept if Canyon is unreachable
+            self.session = requests_cache.CachedSession(
+                'canyon_http_cache',
+                backend='sqlite',
+                expire_after=timedelta(hours=24),
+                allowable_methods=('GET',),
+                cache_control=True,
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update(self.headers)
         
+        # Keep connections to Canyon alive across requests and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -48,11 +609,29 @@ class CanyonBikeScraper:
         )
         self.logger = logging.getLogger(__name__)
         
+        if use_cache and not REQUESTS_CACHE_AVAILABLE:
+            self.logger.warning("requests-cache is not installed - running without HTTP cache")
+        
         # Image download settings
         self.download_images = True  # Set to False to disable image downloading
         self.images_base_dir = "images"
         self.max_image_size_mb = 10  # Skip images larger than this
         self.supported_formats = ['.jpg', '.jpeg', '.png', '.webp']
+        # Image folders already created during this run
+        self.created_dirs = set()
+        
+        # Number of bikes whose detail pages are fetched concurrently
+        self.max_workers = 4
+        # Bikes started per second across all workers, the pace of the old one second sleep.
+        # One token covers all of a bike's requests: its detail page, onderdelen fragment
+        # and images
+        self.rate_limiter = RateLimiter(rate=1.0, burst=4)
+        # Number of images downloaded concurrently for each bike
+        self.image_workers = 4
+        
+        # Generate the WordPress CSV after saving (run_all_scrapers.py turns this off and
+        # converts once every scraper has finished)
+        self.generate_wordpress = True
 
     def format_color_name(self, variant):
         """Format color variant name for better readability"""
@@ -69,24 +648,7 @@ class CanyonBikeScraper:
             word = word.strip()
             if word:
                 # Handle special cases
-                if word.lower() == 'reddark':
-                    formatted_words.append('Red Dark')
-                elif word.lower() == 'bluedark':
-                    formatted_words.append('Blue Dark')
-                elif word.lower() == 'greydark':
-                    formatted_words.append('Grey Dark')
-                elif word.lower() == 'greendark':
-                    formatted_words.append('Green Dark')
-                elif word.lower() == 'tealdark':
-                    formatted_words.append('Teal Dark')
-                elif word.lower() == 'bluelight':
-                    formatted_words.append('Blue Light')
-                elif word.lower() == 'greenlight':
-                    formatted_words.append('Green Light')
-                elif word.lower() == 'greylight':
-                    formatted_words.append('Grey Light')
-                else:
-                    formatted_words.append(word.capitalize())
+                formatted_words.append(_SPECIAL_COLOR_NAMES.get(word.lower(), word.capitalize()))
         
         return '/'.join(formatted_words)
 
@@ -94,20 +656,21 @@ class CanyonBikeScraper:
         """Extract bike data from dataLayer JavaScript"""
         bikes = []
         
-        # Get the raw HTML content to search for dataLayer data
-        # This handles cases where script tags might have unusual names or attributes
-        html_content = str(soup)
+        # Look for the impressions array in the script tags themselves instead of
+        # re-serializing the whole document (this also covers non-standard <script2> tags)
+        impressions_match = None
+        for script in soup.find_all(_SCRIPT_TAG_RE):
+            script_content = script.string or ''
+            impressions_match = _IMPRESSIONS_RE.search(script_content)
+            if impressions_match:
+                break
         
-        # Look for impressions array in the raw content
-        impressions_match = re.search(r'"impressions"\s*:\s*(\[.*?\])', html_content, re.DOTALL)
         if impressions_match:
+            # Collapse whitespace first: raw newlines and tabs inside string values are
+            # not valid JSON, and the collapsed text parses with either decoder
+            impressions_json = _WHITESPACE_RE.sub(' ', impressions_match.group(1)).strip()
             try:
-                impressions_json = impressions_match.group(1)
-                # Clean up the JSON - remove extra whitespace and ensure proper formatting
-                impressions_json = re.sub(r'\s+', ' ', impressions_json)
-                impressions_json = impressions_json.strip()
-                
-                impressions = json.loads(impressions_json)
+                impressions = json_loads(impressions_json)
                 self.logger.info(f"Successfully parsed {len(impressions)} bikes from impressions")
                 
                 for impression in impressions:
@@ -128,7 +691,7 @@ class CanyonBikeScraper:
             except json.JSONDecodeError as e:
                 self.logger.error(f"Failed to parse impressions JSON: {e}")
                 # Log a sample of the problematic JSON for debugging
-                sample = impressions_json[:200] if 'impressions_json' in locals() else 'N/A'
+                sample = impressions_json[:200]
                 self.logger.error(f"JSON sample: {sample}")
         
         # Fallback: Try traditional script tag parsing
@@ -139,11 +702,11 @@ class CanyonBikeScraper:
                     script_content = script.string
                     
                     # Look for ecommerce items array
-                    ecommerce_match = re.search(r'ecommerce["\']?\s*:\s*{[^}]*items["\']?\s*:\s*(\[.*?\])', script_content, re.DOTALL)
+                    ecommerce_match = _ECOMMERCE_ITEMS_RE.search(script_content)
                     if ecommerce_match:
                         try:
                             items_json = ecommerce_match.group(1)
-                            items = json.loads(items_json)
+                            items = json_loads(items_json)
                             
                             for item in items:
                                 if isinstance(item, dict):
@@ -177,27 +740,35 @@ class CanyonBikeScraper:
                 script_content = script.string
                 
                 # Pattern 1: Direct color array in JavaScript
-                color_pattern = r'"name"\s*:\s*"([^"]+)".*?"color"\s*:\s*\[\s*((?:"[^"]*"(?:\s*,\s*)?)+)\s*\]'
-                matches = re.findall(color_pattern, script_content, re.DOTALL)
+                matches = _COLOR_ARRAY_RE.findall(script_content)
                 
                 for bike_name, colors_str in matches:
-                    colors = re.findall(r'"([^"]+)"', colors_str)
+                    colors = _QUOTED_RE.findall(colors_str)
                     if colors:
                         color_variants[bike_name] = colors
                         self.logger.info(f"Found {len(colors)} color variants for {bike_name}: {colors}")
                 
                 # Pattern 2: HTML entity encoded colors
-                entity_pattern = r'"name"\s*:\s*"([^"]+)".*?&#034;color&#034;\s*:\s*\[\s*((?:&#034;[^&]*&#034;(?:\s*,\s*)?)+)\s*\]'
-                entity_matches = re.findall(entity_pattern, script_content, re.DOTALL)
+                entity_matches = _COLOR_ENTITY_ARRAY_RE.findall(script_content)
                 
                 for bike_name, colors_str in entity_matches:
-                    colors = re.findall(r'&#034;([^&]*)&#034;', colors_str)
+                    colors = _ENTITY_QUOTED_RE.findall(colors_str)
                     if colors:
                         color_variants[bike_name] = colors
                         self.logger.info(f"Found {len(colors)} color variants for {bike_name}: {colors}")
         
         return color_variants
 
+    def parse_response(self, response, parse_only=None):
+        """Parse an HTML response (or just the parts matching parse_only) into a BeautifulSoup tree"""
+        # Reuse the charset the server declared so BeautifulSoup can skip encoding detection.
+        # Without one, requests falls back to ISO-8859-1 for text/html, so let bs4 sniff instead.
+        from_encoding = None
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            from_encoding = response.encoding
+        
+        return BeautifulSoup(response.content, HTML_PARSER, from_encoding=from_encoding, parse_only=parse_only)
+
     def extract_specifications(self, bike_info):
         """Extract detailed specifications from bike detail page"""
         if not bike_info.get('url'):
@@ -208,47 +779,29 @@ class CanyonBikeScraper:
         try:
             response = self.session.get(detail_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.parse_response(response)
             
             specifications = {}
-            import re
             
-            # Extract specifications from tables
-            spec_tables = soup.find_all('table')
-            for table in spec_tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        # Try different methods to extract text
-                        key = cells[0].get_text(strip=True)
-                        if not key:
-                            key = cells[0].text.strip()
-                        if not key:
-                            # Extract text from HTML, removing tags but keeping content
-                            key_html = str(cells[0])
-                            key = re.sub(r'<[^>]+>', ' ', key_html).strip()
-                            key = re.sub(r'\s+', ' ', key).strip()
-                        
-                        value = cells[1].get_text(strip=True) 
-                        if not value:
-                            value = cells[1].text.strip()
-                        if not value:
-                            # Extract text from HTML, removing tags but keeping content
-                            value_html = str(cells[1])
-                            # Remove HTML tags but keep the text content
-                            value = re.sub(r'<[^>]+>', ' ', value_html).strip()
-                            # Clean up extra whitespace
-                            value = re.sub(r'\s+', ' ', value).strip()
-                        
-                        # Clean up the key - remove common prefixes and suffixes
-                        if key.startswith('*'):
-                            key = key[1:].strip()
-                        if ':' in key and key.endswith(':'):
-                            key = key[:-1].strip()
-                        
-                        if key and value and key != value and len(key) < 100 and len(value) < 500:
-                            specifications[key] = value
+            # Page text is collected once and shared by the content-based extractors below
+            page_text = soup.get_text(' ', strip=True)
+            
+            # Extract specifications from table rows
+            for row in soup.select('table tr'):
+                cells = row.find_all(['td', 'th'])
+                if len(cells) >= 2:
+                    # Separate nested tags with a space so their text doesn't run together
+                    key = cells[0].get_text(' ', strip=True)
+                    value = cells[1].get_text(' ', strip=True)
+                    
+                    # Clean up the key - remove common prefixes and suffixes
+                    if key.startswith('*'):
+                        key = key[1:].strip()
+                    if ':' in key and key.endswith(':'):
+                        key = key[:-1].strip()
+                    
+                    if key and value and key != value and len(key) < 100 and len(value) < 500:
+                        specifications[key] = value
             
             # Extract specifications from definition lists
             spec_lists = soup.find_all('dl')
@@ -262,7 +815,7 @@ class CanyonBikeScraper:
                         specifications[key] = value
             
             # Extract fork information from content
-            fork_info = self.extract_fork_info_from_content(soup)
+            fork_info = self.extract_fork_info_from_text(page_text)
             if fork_info:
                 specifications['Voorvork'] = fork_info
                 self.logger.info(f"Extracted fork info from content: {fork_info[:50]}...")
@@ -276,7 +829,7 @@ class CanyonBikeScraper:
             
             # Try to extract bottom bracket from page content if missing
             if 'Bottom bracket' not in specifications or not specifications.get('Bottom bracket'):
-                bottom_bracket = self.extract_bottom_bracket_from_content(soup)
+                bottom_bracket = self.extract_bottom_bracket_from_text(page_text)
                 if bottom_bracket:
                     specifications['Bottom bracket'] = bottom_bracket
                     self.logger.info(f"Extracted bottom bracket from content: {bottom_bracket}")
@@ -289,7 +842,7 @@ class CanyonBikeScraper:
             
             # Try to extract chain information from page content if missing
             if 'Ketting' not in specifications or not specifications.get('Ketting'):
-                chain_info = self.extract_chain_info_from_content(soup)
+                chain_info = self.extract_chain_info_from_text(page_text)
                 if chain_info:
                     specifications['Ketting'] = chain_info
                     self.logger.info(f"Extracted chain info from content: {chain_info}")
@@ -340,20 +893,15 @@ class CanyonBikeScraper:
             self.logger.error(f"Error extracting specifications for {bike_info.get('name', 'Unknown')}: {e}")
             return {}
 
-    def extract_fork_info_from_content(self, soup):
-        """Extract fork information from page content"""
-        content_text = soup.get_text().lower()
+    def extract_fork_info_from_text(self, page_text):
+        """Extract fork information from page text"""
+        # Every fork pattern needs "fork" or "voorvork"; skip the regex scans otherwise
+        if not _FORK_KEYWORD_RE.search(page_text):
+            return None
         
         # Look for fork-related information
-        fork_patterns = [
-            r'carbon voorvork[^.]*',
-            r'voorvork[^.]*carbon[^.]*',
-            r'fork[^.]*carbon[^.]*',
-            r'carbon fork[^.]*'
-        ]
-        
-        for pattern in fork_patterns:
-            matches = re.findall(pattern, content_text, re.IGNORECASE)
+        for pattern in _FORK_PATTERNS:
+            matches = pattern.findall(page_text)
             if matches:
                 # Return the first meaningful match, cleaned up
                 fork_info = matches[0].strip()
@@ -362,20 +910,16 @@ class CanyonBikeScraper:
         
         return None
 
-    def extract_bottom_bracket_from_content(self, soup):
-        """Extract bottom bracket information from page content"""
-        content_text = soup.get_text()
+    def extract_bottom_bracket_from_text(self, page_text):
+        """Extract bottom bracket information from page text"""
+        # Every bottom bracket pattern needs a brand plus "bottom bracket" or a shell
+        # standard; skip the regex scans when the page lacks either
+        if not all(keyword.search(page_text) for keyword in _BOTTOM_BRACKET_KEYWORD_RES):
+            return None
         
         # Look for bottom bracket patterns
-        bb_patterns = [
-            r'((?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*?(?:T47|BSA|PressFit)[^.]*)',
-            r'((?:T47|BSA|PressFit)[^.]*?(?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*)',
-            r'(Bottom bracket[^.]*(?:SRAM|Praxis|Shimano)[^.]*)',
-            r'((?:SRAM|Praxis|Shimano)[^.]*bottom bracket[^.]*)'
-        ]
-        
-        for pattern in bb_patterns:
-            matches = re.findall(pattern, content_text, re.IGNORECASE)
+        for pattern in _BOTTOM_BRACKET_PATTERNS:
+            matches = pattern.findall(page_text)
             if matches:
                 bb_info = matches[0].strip()
                 if len(bb_info) > 5:  # Only return if it's substantial
@@ -383,20 +927,16 @@ class CanyonBikeScraper:
         
         return None
 
-    def extract_chain_info_from_content(self, soup):
-        """Extract chain information from page content"""
-        content_text = soup.get_text()
+    def extract_chain_info_from_text(self, page_text):
+        """Extract chain information from page text"""
+        # Every chain pattern needs a brand and an "N-speed" count; skip the regex
+        # scans when the page lacks either
+        if not all(keyword.search(page_text) for keyword in _CHAIN_KEYWORD_RES):
+            return None
         
         # Look for chain patterns
-        chain_patterns = [
-            r'((?:SRAM|Shimano|KMC)\s+(?:PC-\d+|HG\d+|CN\d+|XT M\d+|Ultegra|105)[^.]*?(?:\d+-)?\d+-speed)',
-            r'((?:SRAM|Shimano|KMC)\s+[^.]*?(?:\d+-)?\d+-speed[^.]*chain)',
-            r'(chain[^.]*(?:SRAM|Shimano|KMC)[^.]*(?:\d+-)?\d+-speed)',
-            r'((?:\d+-)?\d+-speed[^.]*(?:SRAM|Shimano|KMC)[^.]*chain)'
-        ]
-        
-        for pattern in chain_patterns:
-            matches = re.findall(pattern, content_text, re.IGNORECASE)
+        for pattern in _CHAIN_PATTERNS:
+            matches = pattern.findall(page_text)
             if matches:
                 chain_info = matches[0].strip()
                 if len(chain_info) > 5:  # Only return if it's substantial
@@ -413,16 +953,8 @@ class CanyonBikeScraper:
         weight_limit_spec = str(weight_limit_spec).strip()
         
         # Look for weight patterns in the text
-        import re
-        
-        # Pattern to match weight limits like "125 kg", "150 kg", etc.
-        weight_patterns = [
-            r'(\d+(?:[.,]\d+)?\s*kg)',
-            r'(\d+(?:[.,]\d+)?\s*lbs?)',
-        ]
-        
-        for pattern in weight_patterns:
-            match = re.search(pattern, weight_limit_spec, re.IGNORECASE)
+        for pattern in _WEIGHT_LIMIT_PATTERNS:
+            match = pattern.search(weight_limit_spec)
             if match:
                 return match.group(1)
         
@@ -438,22 +970,14 @@ class CanyonBikeScraper:
         weight_spec = str(weight_spec).strip()
         
         # Look for patterns like "8.43 kg / 18.59 lbs" and keep only the kg part
-        import re
-        
-        # Pattern to match kg value followed by optional lbs part
-        # This will match things like "8.43 kg / 18.59 lbs" and extract just "8.43 kg"
-        kg_pattern = r'(\d+(?:[.,]\d+)?\s*kg)(?:\s*/\s*\d+(?:[.,]\d+)?\s*lbs)?'
-        
-        # Find all kg values and remove any lbs parts
-        matches = re.findall(kg_pattern, weight_spec, re.IGNORECASE)
+        matches = _KG_RE.findall(weight_spec)
         
         if matches:
             # Replace the original kg/lbs pattern with just the kg part
             cleaned_spec = weight_spec
             for match in matches:
                 # Find the full pattern (kg + lbs) and replace with just kg
-                full_pattern = r'\d+(?:[.,]\d+)?\s*kg\s*/\s*\d+(?:[.,]\d+)?\s*lbs'
-                cleaned_spec = re.sub(full_pattern, match, cleaned_spec, flags=re.IGNORECASE)
+                cleaned_spec = _KG_LBS_RE.sub(match, cleaned_spec)
             
             return cleaned_spec
         
@@ -468,12 +992,6 @@ class CanyonBikeScraper:
         # Convert to string and clean up
         weight_spec = str(weight_spec).strip()
         
-        import re
-        
-        # Pattern to match numeric frame sizes without cm (like "56 -" but not "56 cm -")
-        # This will match patterns like "56 -" or "58 -" but not "56 cm -" or "ML -" or "M -"
-        numeric_size_pattern = r'(\d+)\s*-\s*(\d+(?:[.,]\d+)?\s*kg)'
-        
         # Check if there's already a cm in the string
         if 'cm' not in weight_spec:
             # Replace numeric sizes with cm added
@@ -482,7 +1000,7 @@ class CanyonBikeScraper:
                 weight_part = match.group(2)
                 return f"{size} cm - {weight_part}"
             
-            weight_spec = re.sub(numeric_size_pattern, add_cm, weight_spec)
+            weight_spec = _NUMERIC_SIZE_WEIGHT_RE.sub(add_cm, weight_spec)
         
         return weight_spec
 
@@ -494,24 +1012,8 @@ class CanyonBikeScraper:
         # Convert to string and clean up
         shifter_spec = str(shifter_spec).strip()
         
-        import re
-        
-        # Pattern to match frame size information at the beginning
-        # This will remove patterns like:
-        # - "Maat: 47, 50, 52, 54, 56, 58, 60, 62 "
-        # - "Maat: XS, S, M, ML, L, XL "
-        size_patterns = [
-            r'^Maat:\s*(?:\d+(?:\s*,\s*\d+)*)\s+',  # Numeric sizes
-            r'^Maat:\s*(?:[A-Z]+(?:\s*,\s*[A-Z]+)*)\s+',  # Letter sizes (XS, S, M, ML, L, XL)
-        ]
-        
-        # Remove any size pattern from the beginning
-        for pattern in size_patterns:
-            cleaned_spec = re.sub(pattern, '', shifter_spec, flags=re.IGNORECASE)
-            if cleaned_spec != shifter_spec:
-                # Pattern matched, use the cleaned version
-                shifter_spec = cleaned_spec
-                break
+        # Remove frame size information from the beginning
+        shifter_spec = _SHIFTER_SIZE_RE.sub('', shifter_spec)
         
         return shifter_spec.strip()
 
@@ -523,17 +1025,9 @@ class CanyonBikeScraper:
         # Convert to string and clean up
         shifter_spec = str(shifter_spec).strip()
         
-        import re
-        
-        # Patterns to match speed information
-        speed_patterns = [
-            r'(\d+)\s*speed',           # "8 speed", "10 Speed"
-            r'(\d+)-speed',             # "9-speed", "11-speed"
-            r'(\d+)\s*versnellingen',   # "10 versnellingen"
-        ]
-        
-        for pattern in speed_patterns:
-            match = re.search(pattern, shifter_spec, re.IGNORECASE)
+        # Match speed information
+        for pattern in _SHIFTER_SPEED_PATTERNS:
+            match = pattern.search(shifter_spec)
             if match:
                 return f"{match.group(1)}-speed"
         
@@ -560,21 +1054,12 @@ class CanyonBikeScraper:
         # Convert to string and clean up
         shifter_spec = str(shifter_spec).strip()
         
-        import re
-        
-        # Patterns to remove speed information
-        speed_patterns = [
-            r',?\s*\d+\s*speed\s*,?',           # ", 8 speed,", "10 Speed"
-            r',?\s*\d+-speed\s*,?',             # ", 9-speed,", "11-speed"
-            r',?\s*\d+\s*versnellingen\s*,?',   # ", 10 versnellingen,"
-        ]
-        
-        for pattern in speed_patterns:
-            shifter_spec = re.sub(pattern, '', shifter_spec, flags=re.IGNORECASE)
+        # Remove speed information in a single pass
+        shifter_spec = _SHIFTER_SPEED_REMOVAL_RE.sub('', shifter_spec)
         
         # Clean up any double commas or spaces
-        shifter_spec = re.sub(r',\s*,', ',', shifter_spec)
-        shifter_spec = re.sub(r'\s+', ' ', shifter_spec)
+        shifter_spec = _DOUBLE_COMMA_RE.sub(',', shifter_spec)
+        shifter_spec = _WHITESPACE_RE.sub(' ', shifter_spec)
         shifter_spec = shifter_spec.strip(' ,')
         
         return shifter_spec
@@ -587,28 +1072,9 @@ class CanyonBikeScraper:
         # Convert to string and clean up
         frame_spec = str(frame_spec).strip()
         
-        # Common frame material patterns
-        patterns = [
-            # OCLV Carbon patterns
-            r'(\d+\s+[Ss]eries\s+OCLV\s+Carbon)',
-            r'(OCLV\s+Carbon\s+\d+)',
-            r'(OCLV\s+Carbon)',
-            # Alpha Aluminium patterns  
-            r'(Ultralicht\s+\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
-            r'(\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
-            r'(Alpha\s+Aluminium\s+\d+)',
-            r'(Alpha\s+Aluminium)',
-            # Other materials
-            r'(Carbon\s+fiber)',
-            r'(Steel)',
-            r'(Titanium)',
-            r'(Chromoly)',
-        ]
-        
         # Try each pattern
-        for pattern in patterns:
-            import re
-            match = re.search(pattern, frame_spec, re.IGNORECASE)
+        for pattern in _FRAME_MATERIAL_PATTERNS:
+            match = pattern.search(frame_spec)
             if match:
                 material = match.group(1)
                 # Capitalize properly
@@ -621,7 +1087,7 @@ class CanyonBikeScraper:
         first_part = frame_spec.split(',')[0].strip()
         if first_part and len(first_part) < 100:
             # Clean up common prefixes/suffixes
-            first_part = re.sub(r'^(Frame[:\s]*)', '', first_part, flags=re.IGNORECASE)
+            first_part = _FRAME_PREFIX_RE.sub('', first_part)
             first_part = first_part.strip()
             if first_part:
                 self.logger.info(f"Using first part as frame material: {first_part}")
@@ -636,35 +1102,14 @@ class CanyonBikeScraper:
         bike_name = bike_info.get('name', '').lower()
         category = bike_info.get('category', '').lower()
         
-        # Endurance bikes
-        if any(series in bike_name for series in ['domane', 'checkpoint']):
-            return 'Endurance'
-        
-        # Race bikes
-        if any(series in bike_name for series in ['madone', 'émonda']):
-            return 'H1.5 Race'
-        
-        # Triathlon bikes
-        if 'speed concept' in bike_name:
-            return 'Triatlon'
+        # Known series first, then a default based on category
+        series = _FRAMEFIT_SERIES_RE.findall(bike_name)
+        if series:
+            return _FRAMEFIT_BY_SERIES[min(series, key=_FRAMEFIT_PRIORITY.get)]
         
-        # Cyclocross bikes
-        if 'boone' in bike_name:
-            return 'H1.5 Race'
-        
-        # Fitness bikes
-        if 'fx' in bike_name:
-            return 'Comfort'
-        
-        # Default based on category
-        if 'performance' in category:
-            return 'H1.5 Race'
-        elif 'gravel' in category or 'cyclocross' in category:
-            return 'Endurance'
-        elif 'fitness' in category:
-            return 'Comfort'
-        elif 'triathlon' in category:
-            return 'Triatlon'
+        categories = _FRAMEFIT_CATEGORY_RE.findall(category)
+        if categories:
+            return _FRAMEFIT_BY_CATEGORY[min(categories, key=_FRAMEFIT_PRIORITY.get)]
         
         return None
 
@@ -673,19 +1118,19 @@ class CanyonBikeScraper:
         bike_name = bike_info.get('name', '').lower()
         
         # SRAM DUB for higher-end bikes
-        if any(series in bike_name for series in ['slr', 'sl 6', 'sl 7', 'sl 8', 'sl 9']) and 'axs' in bike_name:
+        if _BB_DUB_SERIES_RE.search(bike_name) and 'axs' in bike_name:
             return 'SRAM DUB, T47 met schroefdraad, interne lagers'
         
         # SRAM DUB Wide for gravel bikes
-        if any(series in bike_name for series in ['checkpoint']) and any(level in bike_name for level in ['alr', 'sl']):
+        if 'checkpoint' in bike_name and _BB_DUB_WIDE_LEVEL_RE.search(bike_name):
             return 'SRAM DUB Wide, T47 met schroefdraad, interne lagers'
         
         # Praxis for many Trek bikes
-        if any(series in bike_name for series in ['domane', 'émonda', 'madone']):
+        if _BB_PRAXIS_SERIES_RE.search(bike_name):
             return 'Praxis, T47 met schroefdraad, interne lagers'
         
         # Shimano for lower-end and fitness bikes
-        if any(series in bike_name for series in ['fx', 'al 2', 'al 4', 'al 5']):
+        if _BB_SHIMANO_SERIES_RE.search(bike_name):
             if 'fx' in bike_name:
                 return 'Shimano RS500, 86 mm, PressFit'
             else:
@@ -698,42 +1143,16 @@ class CanyonBikeScraper:
         rear_derailleur = specifications.get('Achterderailleur', '').lower()
         cassette = specifications.get('Cassette', '').lower()
         
-        # SRAM chains
-        if 'sram' in rear_derailleur:
-            if 'apex' in rear_derailleur:
-                if '12-speed' in cassette or '12' in cassette:
-                    return 'SRAM Apex, 12-speed'
-                else:
-                    return 'SRAM PC-1130, 11-speed'
-            elif 'rival' in rear_derailleur:
-                if '13-speed' in cassette or '13' in cassette:
-                    return 'SRAM Rival, 13-speed'
-                else:
-                    return 'SRAM Rival, 12-speed'
-            elif 'force' in rear_derailleur:
-                if '13-speed' in cassette or '13' in cassette:
-                    return 'SRAM Force E1, 12/13-speed'
-                else:
-                    return 'SRAM Force, 12-speed'
-            elif 'red' in rear_derailleur:
-                return 'SRAM RED D1, 12-speed'
-        
-        # Shimano chains
-        elif 'shimano' in rear_derailleur:
-            if 'ultegra' in rear_derailleur or 'xt' in rear_derailleur:
-                return 'Shimano XT M8100, 12-speed'
-            elif '105' in rear_derailleur:
-                return 'Shimano SLX M7100, 12-speed'
-            elif 'cues' in rear_derailleur:
-                return 'Shimano CN-LG500, 10-speed'
+        # SRAM or Shimano chains, based on the groupset
+        brand = next((brand for brand in _CHAIN_BY_GROUPSET if brand in rear_derailleur), None)
+        for keywords, cassette_hint, chain, chain_without_hint in _CHAIN_BY_GROUPSET.get(brand, ()):
+            if any(keyword in rear_derailleur for keyword in keywords):
+                return chain if cassette_hint in cassette else chain_without_hint
         
         # Generic fallback based on cassette speed
-        if '11-speed' in cassette or '11' in cassette:
-            return 'SRAM PC-1130, 11-speed'
-        elif '12-speed' in cassette or '12' in cassette:
-            return 'Shimano SLX M7100, 12-speed'
-        elif '10-speed' in cassette or '10' in cassette:
-            return 'Shimano CN-LG500, 10-speed'
+        for speed, chain in _CHAIN_BY_CASSETTE_SPEED:
+            if speed in cassette:
+                return chain
         
         return None
 
@@ -747,9 +1166,11 @@ class CanyonBikeScraper:
         
         is_1x = False
         detection_reason = ""
+        # Classified once; the same answer decides the empty-Voorderailleur fallback below
+        is_2x = self.is_2x_system(crankstel)
         
         # First, check if this is clearly a 2x system - if so, don't classify as 1x
-        if self.is_2x_system(crankstel):
+        if is_2x:
             # This is a 2x system, skip 1x classification
             pass
         # Check for explicit 1x indicators in chainring
@@ -764,7 +1185,7 @@ class CanyonBikeScraper:
         
         # Check for wide range cassettes (typical for 1x systems)
         elif self.is_wide_range_cassette(cassette):
-            cassette_range = re.search(r'(\d+)-(\d+)', cassette)
+            cassette_range = _TEETH_RANGE_RE.search(cassette)
             if cassette_range:
                 min_teeth = int(cassette_range.group(1))
                 max_teeth = int(cassette_range.group(2))
@@ -793,7 +1214,7 @@ class CanyonBikeScraper:
                 specifications['Voorderailleur'] = '1x, geen voorderailleur'
                 self.logger.info(f"Added '1x, geen voorderailleur' for likely 1x system based on component analysis")
             # Check if this is a 2x system that should have a front derailleur
-            elif self.is_2x_system(crankstel):
+            elif is_2x:
                 specifications['Voorderailleur'] = '2x systeem, voorderailleur aanwezig'
                 self.logger.info(f"Added '2x systeem, voorderailleur aanwezig' for 2x system based on crankstel analysis")
             else:
@@ -806,33 +1227,15 @@ class CanyonBikeScraper:
             return False
         
         # First, check for double chainring patterns (2x systems)
-        double_chainring_patterns = [
-            r'\d+/\d+',   # "50/34" pattern
-            r'\d+x\d+',   # "46x30" pattern (Trek uses this format!)
-        ]
-        
-        for pattern in double_chainring_patterns:
-            if re.search(pattern, crankstel, re.IGNORECASE):
-                return False  # This is a 2x system, not 1x
+        if _DOUBLE_CHAINRING_RE.search(crankstel):
+            return False  # This is a 2x system, not 1x
         
         # Look for single chainring patterns
-        single_chainring_patterns = [
-            r'\b40t\b.*ring',           # "40T ring"
-            r'\b42t\b.*ring',           # "42T ring"
-            r'\b40t\b.*kettingblad',    # "40T kettingblad"
-            r'\b42t\b.*kettingblad',    # "42T kettingblad"
-            r'narrow-wide.*kettingblad', # "narrow-wide kettingblad"
-            r'apex 1',                  # "SRAM Apex 1"
-            r'force.*1',                # "SRAM Force 1"
-            r'single.*chainring',       # "single chainring"
-        ]
-        
-        for pattern in single_chainring_patterns:
-            if re.search(pattern, crankstel, re.IGNORECASE):
-                return True
+        if _SINGLE_CHAINRING_RE.search(crankstel):
+            return True
         
         # Check for single number followed by T (like "40T")
-        single_chainring = re.search(r'\b(\d+)t\b', crankstel, re.IGNORECASE)
+        single_chainring = _CHAINRING_TEETH_RE.search(crankstel)
         if single_chainring:
             teeth = int(single_chainring.group(1))
             # Single chainrings are typically 38-46T for road/gravel
@@ -846,20 +1249,8 @@ class CanyonBikeScraper:
         if not cassette:
             return False
         
-        # Wide range cassette patterns for 1x systems
-        wide_range_patterns = [
-            r'10-50', r'10-52', r'11-50', r'11-52',  # Very wide ranges
-            r'10-44', r'10-46', r'11-44', r'11-46',  # Wide ranges
-            r'10-48', r'11-48',                      # Common 1x ranges
-            r'10-42', r'11-42',                      # Moderate 1x ranges
-        ]
-        
-        for pattern in wide_range_patterns:
-            if re.search(pattern, cassette, re.IGNORECASE):
-                return True
-        
-        # Check for numerical range
-        cassette_range = re.search(r'(\d+)-(\d+)', cassette)
+        # Check for numerical range first; it settles most wide cassettes in one parse
+        cassette_range = _TEETH_RANGE_RE.search(cassette)
         if cassette_range:
             min_teeth = int(cassette_range.group(1))
             max_teeth = int(cassette_range.group(2))
@@ -869,7 +1260,9 @@ class CanyonBikeScraper:
             if range_size >= 30:
                 return True
         
-        return False
+        # Wide range cassette patterns for 1x systems, also found after another range
+        # or inside a longer number such as a part code
+        return bool(_WIDE_RANGE_CASSETTE_RE.search(cassette))
     
     def is_1x_rear_derailleur(self, rear_derailleur):
         """Check if rear derailleur is 1x-specific"""
@@ -877,37 +1270,12 @@ class CanyonBikeScraper:
             return False
         
         # 1x-specific rear derailleur patterns
-        onex_patterns = [
-            r'apex 1',              # "SRAM Apex 1"
-            r'apex.*xplr',          # "SRAM Apex XPLR"
-            r'force.*xplr',         # "SRAM Force XPLR"
-            r'red.*xplr',           # "SRAM RED XPLR"
-            r'rival.*xplr',         # "SRAM Rival XPLR"
-            r'grx.*1x',             # "Shimano GRX 1x"
-            r'cues.*gs',            # "Shimano CUES GS" (often 1x)
-        ]
-        
-        for pattern in onex_patterns:
-            if re.search(pattern, rear_derailleur, re.IGNORECASE):
-                return True
-        
-        return False
+        return _ONEX_REAR_DERAILLEUR_RE.search(rear_derailleur) is not None
     
     def is_1x_bike_category(self, bike_name):
         """Check if bike category typically uses 1x systems"""
         # Gravel and some fitness bikes often use 1x
-        onex_categories = [
-            'checkpoint.*alr.*[345]',   # Checkpoint ALR 3, 4, 5 often 1x
-            'fx.*sport',                # FX Sport bikes often 1x
-            'checkmate',                # Checkmate is typically 1x
-            'boone.*5',                 # Boone 5 often 1x
-        ]
-        
-        for pattern in onex_categories:
-            if re.search(pattern, bike_name, re.IGNORECASE):
-                return True
-        
-        return False
+        return _ONEX_CATEGORY_RE.search(bike_name) is not None
     
     def likely_1x_system(self, crankstel, cassette, rear_derailleur, bike_name):
         """Determine if a bike is likely a 1x system based on multiple indicators"""
@@ -938,20 +1306,8 @@ class CanyonBikeScraper:
     
     def is_2x_system(self, crankstel):
         """Check if crankstel indicates a 2x (double chainring) setup"""
-        if not crankstel:
-            return False
-        
         # Look for double chainring patterns like "50/34", "52/36", "48/35", "46x30"
-        double_chainring_patterns = [
-            r'\d+/\d+',   # "50/34" pattern
-            r'\d+x\d+',   # "46x30" pattern (Trek uses this format!)
-        ]
-        
-        for pattern in double_chainring_patterns:
-            if re.search(pattern, crankstel):
-                return True
-        
-        return False
+        return bool(crankstel and _DOUBLE_CHAINRING_RE.search(crankstel))
 
     def extract_description(self, bike_info):
         """Extract bike description from detail page"""
@@ -964,19 +1320,10 @@ class CanyonBikeScraper:
             response = self.session.get(detail_url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.parse_response(response)
             
             # Look for description in various places
-            description_selectors = [
-                'div[data-testid="product-positioning-statement"]',
-                '.product-positioning-statement',
-                '.product-description',
-                '.product-summary',
-                'div.product-details p',
-                'div.product-info p'
-            ]
-            
-            for selector in description_selectors:
+            for selector in _DESCRIPTION_SELECTORS:
                 elements = soup.select(selector)
                 for element in elements:
                     text = element.get_text(strip=True)
@@ -992,154 +1339,68 @@ class CanyonBikeScraper:
             self.logger.error(f"Error extracting description for {bike_info.get('name', 'Unknown')}: {e}")
             return ""
 
+    def normalize_trek_image_urls(self, candidates):
+        """Yield absolute Trek media URLs from raw candidates, dropping malformed ones"""
+        for url in candidates:
+            # Clean up malformed URLs that have color prefixes
+            if '=' in url and '//' in url:
+                url = url.split('=', 1)[-1]
+            
+            if url.startswith('//'):
+                url = 'https:' + url
+            elif not url.startswith('http'):
+                url = 'https://' + url
+            
+            # Skip malformed URLs
+            if url.startswith('https://media.trekbikes.com'):
+                yield url
+
     def extract_hero_carousel_images(self, bike_info):
         """Extract all hero carousel images from bike detail page including color variants"""
         if not bike_info.get('url'):
             return []
             
         detail_url = urljoin(self.base_url, bike_info['url'])
+        bike_name = bike_info.get('name', 'Unknown')
         
         try:
             response = self.session.get(detail_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.parse_response(response)
             
-            hero_images = []
             html_content = str(soup)
             
             # Decode HTML entities to handle encoded quotes properly
             import html as html_module
             decoded_content = html_module.unescape(html_content)
             
-            # Comprehensive patterns to find all carousel images
-            image_patterns = [
-                # Enhanced structured data patterns
-                r'"heroCarousel"\s*:\s*\[([^\]]+)\]',
-                r'"productImages"\s*:\s*\[([^\]]+)\]',
-                r'"imageGallery"\s*:\s*\[([^\]]+)\]',
-                r'"gallery"\s*:\s*\[([^\]]+)\]',
-                r'"images"\s*:\s*\[([^\]]+)\]',
-                r'"slides"\s*:\s*\[([^\]]+)\]',
-                r'"carouselSlides"\s*:\s*\[([^\]]+)\]',
-                
-                # Color variant specific patterns
-                r'"colorSwatchImageUrl"\s*:\s*\[([^\]]+)\]',
-                r'"variantImages"\s*:\s*\[([^\]]+)\]',
-                r'"colorVariants"\s*:\s*\[([^\]]+)\]',
-                
-                # Individual image patterns
-                r'"heroImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"primaryImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"firstVariantImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"thumbnailImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                
-                # URL patterns with various prefixes
-                r'"[a-zA-Z_]*[Uu]rl"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"[a-zA-Z_]*[Ii]mage[a-zA-Z_]*"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                
-                # Enhanced alternative image arrays
-                r'"primaryImages"\s*:\s*\[([^\]]+)\]',
-                r'"galleryImages"\s*:\s*\[([^\]]+)\]',
-                r'"productGallery"\s*:\s*\[([^\]]+)\]',
-                r'"heroImages"\s*:\s*\[([^\]]+)\]',
-            ]
+            # Every pattern below only yields media.trekbikes.com URLs, so a page without
+            # any (such as a Canyon page) can skip all of the regex passes
+            if 'media.trekbikes.com' not in decoded_content:
+                self.logger.warning(f"No hero carousel images found for {bike_name}")
+                return []
             
-            # Process structured data patterns (arrays) - use decoded content
-            for pattern in image_patterns[:13]:  # First 13 are array patterns
-                matches = re.findall(pattern, decoded_content, re.DOTALL)
-                for match in matches:
-                    # Extract all image URLs from the array content
-                    image_urls = re.findall(r'"([^"]*media\.trekbikes\.com[^"]*)"', match)
-                    for url in image_urls:
-                        # Clean up malformed URLs that have color prefixes
-                        if '=' in url and '//' in url:
-                            url = url.split('=', 1)[-1]
-                            
-                        if url.startswith('//'):
-                            url = 'https:' + url
-                        elif not url.startswith('http'):
-                            url = 'https://' + url
-                            
-                        # Skip malformed URLs
-                        if not url.startswith('https://media.trekbikes.com'):
-                            continue
-                            
-                        hero_images.append(url)
-            
-            # Process individual image patterns - use decoded content
-            for pattern in image_patterns[13:16]:  # Individual image patterns
-                matches = re.findall(pattern, decoded_content)
-                for match in matches:
-                    # Clean up malformed URLs that have color prefixes
-                    if '=' in match and '//' in match:
-                        match = match.split('=', 1)[-1]
-                        
-                    if match.startswith('//'):
-                        match = 'https:' + match
-                    elif not match.startswith('http'):
-                        match = 'https://' + match
-                        
-                    # Skip malformed URLs
-                    if not match.startswith('https://media.trekbikes.com'):
-                        continue
-                        
-                    hero_images.append(match)
-            
-            # Process URL and image patterns with various prefixes - use decoded content
-            for pattern in image_patterns[16:18]:  # URL patterns
-                matches = re.findall(pattern, decoded_content)
-                for match in matches:
-                    if '=' in match and '//' in match:
-                        match = match.split('=', 1)[-1]
-                        
-                    if match.startswith('//'):
-                        match = 'https:' + match
-                    elif not match.startswith('http'):
-                        match = 'https://' + match
-                        
-                    if not match.startswith('https://media.trekbikes.com'):
-                        continue
-                        
-                    hero_images.append(match)
-            
-            # Process alternative image arrays - use decoded content
-            for pattern in image_patterns[18:]:  # Alternative image arrays
-                matches = re.findall(pattern, decoded_content, re.DOTALL)
-                for match in matches:
-                    image_urls = re.findall(r'"([^"]*media\.trekbikes\.com[^"]*)"', match)
-                    for url in image_urls:
-                        # Clean up malformed URLs that have color prefixes
-                        if '=' in url and '//' in url:
-                            url = url.split('=', 1)[-1]
-                            
-                        if url.startswith('//'):
-                            url = 'https:' + url
-                        elif not url.startswith('http'):
-                            url = 'https://' + url
-                            
-                        if not url.startswith('https://media.trekbikes.com'):
-                            continue
-                            
-                        hero_images.append(url)
-            
-            # Also search for any high-quality Trek images in the page - use decoded content
-            all_trek_images = re.findall(r'([^"]*media\.trekbikes\.com[^"]*)', decoded_content)
-            for img_url in all_trek_images:
-                # Clean up malformed URLs that have color prefixes
-                if '=' in img_url and '//' in img_url:
-                    # Extract the actual URL after the = sign
-                    img_url = img_url.split('=', 1)[-1]
-                
-                if img_url.startswith('//'):
-                    img_url = 'https:' + img_url
-                elif not img_url.startswith('http'):
-                    img_url = 'https://' + img_url
-                    
-                # Skip malformed URLs
-                if not img_url.startswith('https://media.trekbikes.com'):
-                    continue
-                    
-                hero_images.append(img_url)
+            # Collect candidate URLs from every pattern pass, keeping the pass order
+            candidates = []
+            
+            # Structured data patterns (arrays): extract all image URLs from the array content
+            for pattern in _HERO_ARRAY_PATTERNS:
+                for match in pattern.findall(decoded_content):
+                    candidates.extend(_QUOTED_TREK_MEDIA_URL_RE.findall(match))
+            
+            # Individual image patterns, then URL and image patterns with various prefixes
+            for pattern in _HERO_SINGLE_PATTERNS + _HERO_URL_PATTERNS:
+                candidates.extend(pattern.findall(decoded_content))
+            
+            # Alternative image arrays
+            for pattern in _HERO_ALT_ARRAY_PATTERNS:
+                for match in pattern.findall(decoded_content):
+                    candidates.extend(_QUOTED_TREK_MEDIA_URL_RE.findall(match))
+            
+            # Also search for any high-quality Trek images in the page
+            candidates.extend(_TREK_MEDIA_URL_RE.findall(decoded_content))
+            
+            hero_images = self.normalize_trek_image_urls(candidates)
             
             # Filter for high-quality images and remove unwanted types
             quality_images = []
@@ -1148,54 +1409,32 @@ class CanyonBikeScraper:
                 if 'media.trekbikes.com' not in img_url:
                     continue
                     
-                # Skip tiny thumbnails and low-quality images
-                if any(skip in img_url.lower() for skip in ['thumb', 'icon', 'logo', 'badge', 'w_50', 'w_100', 'w_150', 'h_50', 'h_100']):
+                # Skip tiny thumbnails, low-quality images and default placeholders
+                if _HERO_SKIP_RE.search(img_url):
                     continue
                 
-                # Skip default placeholder images
-                if any(skip in img_url for skip in ['default-no-image', 'CyclingTips']):
-                    continue
-                
-                # Prefer high-quality images
-                is_high_quality = any(quality in img_url for quality in [
-                    'w_1360', 'w_1200', 'w_690', 'w_800', 'w_1000',
-                    'Primary', 'Hero', 'Detail', 'Gallery', 'Portrait',
-                    'h_1020', 'h_800', 'h_600'
-                ])
-                
-                # Accept medium quality if we don't have many images yet
-                is_medium_quality = any(medium in img_url for medium in [
-                    'w_400', 'w_500', 'w_600', 'h_300', 'h_400', 'h_518'
-                ])
-                
-                if is_high_quality or (is_medium_quality and len(quality_images) < 10):
+                # Prefer high-quality images, and accept medium quality if we don't have many images yet
+                if _HERO_HIGH_QUALITY_RE.search(img_url) or (len(quality_images) < 10 and _HERO_MEDIUM_QUALITY_RE.search(img_url)):
                     quality_images.append(img_url)
             
-            # Remove duplicates while preserving order
-            unique_images = []
-            seen_urls = set()
-            seen_paths = set()  # Track image paths to avoid same image with different transformations
-            
+            # Remove duplicates while preserving order, keyed on the base image path
+            # to avoid the same image with different transformations
+            images_by_path = {}
             for img_url in quality_images:
-                # Extract the base image path to avoid duplicates with different sizes
-                base_path = re.sub(r'/image/upload/[^/]+/', '/image/upload/', img_url)
-                
-                if img_url not in seen_urls and base_path not in seen_paths:
-                    unique_images.append(img_url)
-                    seen_urls.add(img_url)
-                    seen_paths.add(base_path)
+                images_by_path.setdefault(_UPLOAD_TRANSFORM_RE.sub('/image/upload/', img_url), img_url)
+            unique_images = list(images_by_path.values())
             
             if unique_images:
-                self.logger.info(f"Found {len(unique_images)} hero carousel images for {bike_info.get('name', 'Unknown')}")
+                self.logger.info(f"Found {len(unique_images)} hero carousel images for {bike_name}")
                 for i, img_url in enumerate(unique_images, 1):
                     self.logger.debug(f"  Image {i}: {img_url}")
             else:
-                self.logger.warning(f"No hero carousel images found for {bike_info.get('name', 'Unknown')}")
+                self.logger.warning(f"No hero carousel images found for {bike_name}")
             
             return unique_images
             
         except Exception as e:
-            self.logger.error(f"Error extracting hero carousel images for {bike_info.get('name', 'Unknown')}: {e}")
+            self.logger.error(f"Error extracting hero carousel images for {bike_name}: {e}")
             return []
 
 
@@ -1207,25 +1446,49 @@ class CanyonBikeScraper:
                 self.logger.info(f"Image already exists, skipping: {os.path.basename(save_path)}")
                 return True
             
-            # Download the image
-            response = self.session.get(image_url, stream=True, timeout=30)
-            response.raise_for_status()
+            max_bytes = self.max_image_size_mb * 1024 * 1024
             
-            # Check file size
-            content_length = response.headers.get('content-length')
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-                if size_mb > self.max_image_size_mb:
-                    self.logger.warning(f"Skipping large image ({size_mb:.1f}MB): {image_url}")
+            # Download the image; the with block hands the connection back to the pool
+            # even when the body is skipped
+            with self.session.get(image_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                
+                # Check file size before reading the body
+                content_length = response.headers.get('content-length')
+                if content_length:
+                    size_mb = int(content_length) / (1024 * 1024)
+                    if size_mb > self.max_image_size_mb:
+                        self.logger.warning(f"Skipping large image ({size_mb:.1f}MB): {image_url}")
+                        return False
+                
+                # Ensure directory exists
+                self.ensure_directory(os.path.dirname(save_path))
+                
+                # Save the image under a per-thread name first, so concurrent downloads of the
+                # same file never interleave and an interrupted download leaves no partial image
+                part_path = f"{save_path}.{threading.get_ident()}.part"
+                written = 0
+                try:
+                    with open(part_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):
+                            written += len(chunk)
+                            if written > max_bytes:
+                                break
+                            f.write(chunk)
+                except BaseException:
+                    # The stream broke off (timeout, reset, ...): drop the partial file
+                    try:
+                        os.remove(part_path)
+                    except FileNotFoundError:
+                        pass
+                    raise
+                
+                # Without a Content-Length the size limit is enforced while streaming
+                if written > max_bytes:
+                    os.remove(part_path)
+                    self.logger.warning(f"Skipping large image (over {self.max_image_size_mb}MB): {image_url}")
                     return False
-            
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            
-            # Save the image
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                os.replace(part_path, save_path)
             
             file_size = os.path.getsize(save_path) / (1024 * 1024)
             self.logger.info(f"Downloaded image ({file_size:.1f}MB): {os.path.basename(save_path)}")
@@ -1235,6 +1498,12 @@ class CanyonBikeScraper:
             self.logger.error(f"Error downloading image {image_url}: {e}")
             return False
 
+    def ensure_directory(self, directory):
+        """Create directory once per run; later images for the same bike skip the syscall"""
+        if directory not in self.created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self.created_dirs.add(directory)
+
     def get_image_filename_from_url(self, image_url):
         """Extract a clean filename from image URL"""
         # Parse the URL to get the path
@@ -1257,7 +1526,7 @@ class CanyonBikeScraper:
                 filename = 'image.jpg'
         
         # Clean up filename - remove special characters
-        filename = re.sub(r'[^\w\-_\.]', '_', filename)
+        filename = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
         
         return filename
 
@@ -1270,8 +1539,8 @@ class CanyonBikeScraper:
         brand = bike_info.get('brand', 'Trek')
         
         # Clean bike name for folder structure
-        clean_bike_name = re.sub(r'[^\w\-_\s]', '', bike_name)
-        clean_bike_name = re.sub(r'\s+', '_', clean_bike_name.strip())
+        clean_bike_name = _UNSAFE_FOLDER_CHARS_RE.sub('', bike_name)
+        clean_bike_name = _WHITESPACE_RE.sub('_', clean_bike_name.strip())
         
         # Create brand folder path
         brand_folder = os.path.join(self.images_base_dir, brand)
@@ -1331,22 +1600,14 @@ class CanyonBikeScraper:
                         # Extract from URL
                         series_name = href.split('/')[-2] if href else "Unknown"
                     
-                    if href and href not in ['/nl-nl/racefietsen/endurance-racefietsen/', '/nl-nl/racefietsen/wielrenfietsen/', '/nl-nl/racefietsen/aero-racefietsen/']:
+                    if href and href not in _SERIES_PAGE_HREFS:
                         continue
                         
                     full_url = urljoin(self.base_url, href)
                     series_links[series_name] = full_url
             
             # Also look for direct series links
-            series_selectors = [
-                'a[href*="endurance"]',
-                'a[href*="ultimate"]', 
-                'a[href*="aeroad"]',
-                'a[href*="speedmax"]',
-                'a[href*="inflite"]'
-            ]
-            
-            for selector in series_selectors:
+            for selector in _SERIES_LINK_SELECTORS:
                 elements = soup.select(selector)
                 for elem in elements:
                     href = elem.get('href')
@@ -1370,7 +1631,7 @@ class CanyonBikeScraper:
             response = self.session.get(series_url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.parse_response(response)
             
             # Look for individual bike links
             bike_links = soup.select('a[href*=".html"]')
@@ -1404,14 +1665,11 @@ class CanyonBikeScraper:
                     
                     bikes.append(bike_info)
             
-            # Remove duplicates by URL
-            unique_bikes = []
-            seen_urls = set()
-            
+            # Remove duplicates by URL, keeping the first occurrence in page order
+            bikes_by_url = {}
             for bike in bikes:
-                if bike['url'] not in seen_urls:
-                    unique_bikes.append(bike)
-                    seen_urls.add(bike['url'])
+                bikes_by_url.setdefault(bike['url'], bike)
+            unique_bikes = list(bikes_by_url.values())
             
             self.logger.info(f"Found {len(unique_bikes)} unique bikes in series: {series_name}")
             return unique_bikes
@@ -1429,7 +1687,9 @@ class CanyonBikeScraper:
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.parse_response(response)
+            # The price fallback and the specification patterns both scan the full page text
+            page_text = soup.get_text()
             
             # Extract bike name (more detailed)
             name = self.extract_canyon_name(soup)
@@ -1437,12 +1697,12 @@ class CanyonBikeScraper:
                 bike_info['name'] = name
             
             # Extract price
-            price = self.extract_canyon_price(soup)
+            price = self.extract_canyon_price(soup, page_text)
             if price:
                 bike_info['price'] = price
             
             # Extract specifications
-            specifications = self.extract_canyon_specifications(soup)
+            specifications = self.extract_canyon_specifications(soup, page_text)
             if specifications:
                 bike_info['specifications'] = specifications
             
@@ -1481,69 +1741,44 @@ class CanyonBikeScraper:
     def extract_canyon_name(self, soup):
         """Extract bike name from Canyon page"""
         # Look for product title in Canyon's structure
-        selectors = [
-            'h1',
-            '.pdpDetailHero h1',
-            '.productDetailHero__productTitle',
-            'h1[class*="productTitle"]',
-            'h1[class*="product-title"]',
-            '.product-name h1'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                name = elements[0].get_text(strip=True)
+        for selector in _CANYON_NAME_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                name = element.get_text(strip=True)
                 if name and len(name) > 3:
                     return name
         
         return None
 
-    def extract_canyon_price(self, soup):
+    def extract_canyon_price(self, soup, page_text=None):
         """Extract price from Canyon page"""
         # Look for price in Canyon's structure
         price_text = None
         
         # Try multiple selectors for price
-        price_selectors = [
-            '.price',
-            '.pdpDetailHero .price',
-            '.price-current',
-            '.price__current',
-            '[class*="price"]'
-        ]
-        
-        for selector in price_selectors:
-            elements = soup.select(selector)
-            if elements:
-                price_text = elements[0].get_text(strip=True)
+        for selector in _CANYON_PRICE_SELECTORS:
+            element = soup.select_one(selector)
+            if element:
+                price_text = element.get_text(strip=True)
                 break
         
         # Also try to find price in the text content
         if not price_text:
             # Look for Euro symbol followed by price pattern
-            text_content = soup.get_text()
-            import re
-            price_patterns = [
-                r'(\d+\.?\d*)\s*€',  # "1.849 €"
-                r'€\s*(\d+\.?\d*)',  # "€ 1849"
-                r'(\d+,\d+)\s*€',    # "1,849 €"
-                r'€\s*(\d+,\d+)'     # "€ 1,849"
-            ]
+            text_content = page_text if page_text is not None else soup.get_text()
             
-            for pattern in price_patterns:
-                matches = re.findall(pattern, text_content)
-                if matches:
-                    price_str = matches[0].replace('.', '').replace(',', '.')
+            for pattern in _PRICE_TEXT_PATTERNS:
+                match = pattern.search(text_content)
+                if match:
+                    price_str = match.group(1).replace('.', '').replace(',', '.')
                     try:
                         return float(price_str)
                     except:
-                        return matches[0]
+                        return match.group(1)
         
         if price_text:
             # Extract numeric price from text
-            import re
-            price_match = re.search(r'[\d.,]+', price_text.replace('€', ''))
+            price_match = _PRICE_DIGITS_RE.search(price_text.replace('€', ''))
             if price_match:
                 try:
                     price_str = price_match.group().replace('.', '').replace(',', '.')
@@ -1553,7 +1788,7 @@ class CanyonBikeScraper:
         
         return None
 
-    def extract_canyon_specifications(self, soup):
+    def extract_canyon_specifications(self, soup, page_text=None):
         """Extract detailed Dutch specifications from Canyon bike page"""
         specs = {}
         
@@ -1570,62 +1805,8 @@ class CanyonBikeScraper:
                 'Shifter_speed': '', 'Material': '', 'Weight': ''
             }
             
-            # Specification mapping from various Dutch/English terms to our standard names
-            spec_mapping = {
-                # Frame specifications
-                'frame': 'Frame', 'kader': 'Frame', 'frameset': 'Frame',
-                'framefit': 'Framefit', 'frame fit': 'Framefit',
-                'gewicht': 'Gewicht', 'weight': 'Weight', 'massa': 'Gewicht',
-                'gewichtslimiet': 'Gewichtslimiet', 'weight limit': 'Gewichtslimiet',
-                'maximum weight': 'Gewichtslimiet', 'max gewicht': 'Gewichtslimiet',
-                
-                # Drivetrain
-                'shifter': 'Shifter', 'schakelhendel': 'Shifter', 'schakelaar': 'Shifter',
-                'voorderailleur': 'Voorderailleur', 'front derailleur': 'Voorderailleur',
-                'achterderailleur': 'Achterderailleur', 'rear derailleur': 'Achterderailleur',
-                'derailleur achter': 'Achterderailleur', 'derailleur voor': 'Voorderailleur',
-                'crankstel': 'Crankstel', 'crankset': 'Crankstel', 'crank': 'Crankstel',
-                'bottom bracket': 'Bottom_bracket', 'trapas': 'Bottom_bracket',
-                'cassette': 'Cassette', 'tandwielcassette': 'Cassette',
-                'ketting': 'Ketting', 'chain': 'Ketting',
-                'pedaal': 'Pedaal', 'pedal': 'Pedaal', 'pedalen': 'Pedaal',
-                'kettingblad': 'Maximale_maat_kettingblad', 'chainring': 'Maximale_maat_kettingblad',
-                
-                # Wheels & Tires
-                'naaf voor': 'Naaf_voor', 'front hub': 'Naaf_voor', 'voornaaf': 'Naaf_voor',
-                'as voorwiel': 'As_voorwiel', 'front axle': 'As_voorwiel', 'vooras': 'As_voorwiel',
-                'naaf achter': 'Naaf_achter', 'rear hub': 'Naaf_achter', 'achternaaf': 'Naaf_achter',
-                'velg': 'Velg', 'rim': 'Velg', 'velgen': 'Velg',
-                'buitenband': 'Buitenband', 'tire': 'Buitenband', 'band': 'Buitenband',
-                'bandenmaaat': 'Maximale_bandenmaat', 'tire size': 'Maximale_bandenmaat',
-                'max tire': 'Maximale_bandenmaat', 'max band': 'Maximale_bandenmaat',
-                
-                # Cockpit
-                'zadel': 'Zadel', 'saddle': 'Zadel', 'zitting': 'Zadel',
-                'zadelpen': 'Zadelpen', 'seatpost': 'Zadelpen', 'zadelstam': 'Zadelpen',
-                'stuur': 'Stuur', 'handlebar': 'Stuur', 'handlebars': 'Stuur',
-                'stuurlint': 'Stuurlint', 'bar tape': 'Stuurlint', 'tape': 'Stuurlint',
-                'stuurpen': 'Stuurpen', 'stem': 'Stuurpen', 'voorstam': 'Stuurpen',
-                'balhoofdstel': 'Balhoofdstel', 'headset': 'Balhoofdstel',
-                
-                # Brakes & Other
-                'rem': 'Rem', 'brake': 'Rem', 'remmen': 'Rem', 'brakes': 'Rem',
-                'speed': 'Shifter_speed', 'versnellingen': 'Shifter_speed',
-                'aantal versnellingen': 'Shifter_speed',
-                
-                # Material
-                'material': 'Material', 'materiaal': 'Material'
-            }
-            
             # Method 1: Look for specification tables and sections
-            spec_selectors = [
-                'table tr', '.spec-table tr', '.specifications tr',
-                '.component-table tr', '.tech-specs tr', '.bike-specs tr',
-                '[class*="spec"] tr', '[class*="component"] tr',
-                '.product-specs tr', '.details-table tr'
-            ]
-            
-            for selector in spec_selectors:
+            for selector in _CANYON_SPEC_ROW_SELECTORS:
                 rows = soup.select(selector)
                 for row in rows:
                     cells = row.find_all(['td', 'th'])
@@ -1638,7 +1819,7 @@ class CanyonBikeScraper:
                         
                         if key and value and len(value) < 200:
                             # Map to our standard specification names
-                            for pattern, std_name in spec_mapping.items():
+                            for pattern, std_name in _CANYON_SPEC_MAPPING.items():
                                 if pattern in key:
                                     required_specs[std_name] = value
                                     break
@@ -1655,13 +1836,14 @@ class CanyonBikeScraper:
                     key = key.replace(':', '').replace('-', ' ').strip()
                     
                     if key and value:
-                        for pattern, std_name in spec_mapping.items():
+                        for pattern, std_name in _CANYON_SPEC_MAPPING.items():
                             if pattern in key:
                                 required_specs[std_name] = value
                                 break
             
             # Method 3: Extract from page text using patterns
-            page_text = soup.get_text()
+            if page_text is None:
+                page_text = soup.get_text()
             
             # Extract material from known keywords
             material_keywords = ['Carbon CFR', 'Carbon CF SLX', 'Carbon CF', 'Aluminium AL', 'Carbon', 'Aluminium']
@@ -1671,18 +1853,15 @@ class CanyonBikeScraper:
                     break
             
             # Extract weight using regex
-            import re
-            weight_pattern = r'(\d+[,.]?\d*)\s*kg'
-            weight_matches = re.findall(weight_pattern, page_text)
-            if weight_matches and not required_specs['Gewicht']:
-                required_specs['Gewicht'] = f"{weight_matches[0].replace(',', '.')} kg"
+            weight_match = None if required_specs['Gewicht'] else _PAGE_WEIGHT_RE.search(page_text)
+            if weight_match:
+                required_specs['Gewicht'] = f"{weight_match.group(1).replace(',', '.')} kg"
                 required_specs['Weight'] = required_specs['Gewicht']
             
             # Extract speed count (number of gears)
-            speed_pattern = r'(\d+)\s*(?:speed|versnellingen|Speed)'
-            speed_matches = re.findall(speed_pattern, page_text)
-            if speed_matches and not required_specs['Shifter_speed']:
-                required_specs['Shifter_speed'] = f"{speed_matches[0]} speed"
+            speed_match = None if required_specs['Shifter_speed'] else _PAGE_SPEED_RE.search(page_text)
+            if speed_match:
+                required_specs['Shifter_speed'] = f"{speed_match.group(1)} speed"
             
             # Try to get detailed component specifications from onderdelen section
             try:
@@ -1724,19 +1903,7 @@ class CanyonBikeScraper:
         """Extract description from Canyon bike page"""
         try:
             # Look for description in Canyon's structure
-            desc_selectors = [
-                '.pdpDetailHero p',
-                '.product-description',
-                '.product-positioning',
-                '.bike-description', 
-                '.description p',
-                '[class*="description"] p',
-                '.product-details p',
-                '.productDetailContent p',
-                '.hero-description p'
-            ]
-            
-            for selector in desc_selectors:
+            for selector in _CANYON_DESCRIPTION_SELECTORS:
                 elements = soup.select(selector)
                 for element in elements:
                     desc = element.get_text(strip=True)
@@ -1749,8 +1916,7 @@ class CanyonBikeScraper:
                 text = p.get_text(strip=True)
                 if text and len(text) > 100 and len(text) < 1000:  # Reasonable description length
                     # Skip common non-description text
-                    skip_phrases = ['cookie', 'privacy', 'newsletter', 'copyright', 'terms', 'conditions']
-                    if not any(phrase in text.lower() for phrase in skip_phrases):
+                    if not _SKIP_DESCRIPTION_RE.search(text.lower()):
                         return text
             
             return ""
@@ -1764,25 +1930,16 @@ class CanyonBikeScraper:
         images = []
         
         try:
-            # Look for Canyon images in various locations
-            img_selectors = [
-                'img[src*="canyon"]',
-                'img[data-src*="canyon"]',
-                'img[src*="dma.canyon.com"]',
-                'img[data-src*="dma.canyon.com"]',
-                '.productDetailHero img',
-                '.productCarousel img',
-                '.gallery img'
-            ]
-            
+            image_urls = []
             found_urls = set()
             
-            for selector in img_selectors:
+            # Look for Canyon images in various locations
+            for selector in _CANYON_IMAGE_SELECTORS:
                 img_elements = soup.select(selector)
                 
                 for img in img_elements:
                     src = img.get('src') or img.get('data-src')
-                    if src and src not in found_urls:
+                    if src:
                         # Ensure full URL
                         if src.startswith('//'):
                             src = 'https:' + src
@@ -1790,14 +1947,19 @@ class CanyonBikeScraper:
                             src = 'https://www.canyon.com' + src
                         
                         # Check if it's a valid Canyon image
-                        if ('canyon.com' in src or 'dma.canyon.com' in src) and any(ext in src.lower() for ext in ['.jpg', '.jpeg', '.png', '.webp']):
+                        if src not in found_urls and ('canyon.com' in src or 'dma.canyon.com' in src) and any(ext in src.lower() for ext in ['.jpg', '.jpeg', '.png', '.webp']):
                             found_urls.add(src)
+                            image_urls.append(src)
+                            if len(image_urls) >= 10:  # Limit to 10 images
+                                break
+                
+                if len(image_urls) >= 10:
+                    break
             
-            # Download and save images
-            for img_url in list(found_urls)[:10]:  # Limit to 10 images
-                downloaded_img = self.download_canyon_image(img_url, bike_info)
-                if downloaded_img:
-                    images.append(downloaded_img)
+            # Download and save images in parallel, keeping page order
+            with ThreadPoolExecutor(max_workers=self.image_workers) as executor:
+                downloaded_images = executor.map(lambda img_url: self.download_canyon_image(img_url, bike_info), image_urls)
+                images = [downloaded_img for downloaded_img in downloaded_images if downloaded_img]
             
             return images
             
@@ -1836,7 +1998,7 @@ class CanyonBikeScraper:
             # Create directory structure
             bike_name = bike_info.get('name', 'Unknown').replace('/', '_').replace(' ', '_')
             bike_dir = os.path.join(self.images_base_dir, 'Canyon', bike_name)
-            os.makedirs(bike_dir, exist_ok=True)
+            self.ensure_directory(bike_dir)
             
             # Save image
             save_path = os.path.join(bike_dir, filename)
@@ -1898,6 +2060,24 @@ class CanyonBikeScraper:
             self.logger.error(f"Error extracting colors: {e}")
             return []
 
+    def process_bike(self, bike_info, index, total):
+        """Extract detailed specifications and data for a single bike"""
+        bike_name = bike_info.get('name', 'Unknown')
+        
+        # Take this bike's token from the shared budget before fetching anything, so parsing
+        # counts against the delay
+        self.rate_limiter.acquire()
+        self.logger.info(f"Processing bike {index}/{total}: {bike_name}")
+        
+        detailed_bike = self.extract_bike_details(bike_info)
+        
+        if detailed_bike:
+            self.logger.info(f"Successfully processed {bike_name}")
+        else:
+            self.logger.warning(f"Failed to process {bike_name}")
+        
+        return detailed_bike
+
     def scrape_canyon_bikes(self):
         """Main scraping method for Canyon bikes"""
         # Canyon road bikes listing URL (Dutch site) with all products shown
@@ -1909,10 +2089,12 @@ class CanyonBikeScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.parse_response(response)
             
-            # Find all individual bike product links
-            all_bike_links = []
+            # Find all individual bike product links, keeping only the first link per
+            # base URL (ignore color variants) so duplicates never get a bike_info built
+            bike_link_count = 0
+            bikes_by_base_url = {}
             
             # Look for all links on the page
             links = soup.find_all('a', href=True)
@@ -1928,64 +2110,42 @@ class CanyonBikeScraper:
                 
                 # Check if this is a valid Canyon bike product page
                 if self.is_valid_canyon_bike_url(href):
+                    bike_link_count += 1
+                    base_url = self.get_base_bike_url(href)  # For deduplication
+                    if base_url in bikes_by_base_url:
+                        continue
+                    
                     # Extract bike name from link text or surrounding elements
                     bike_name = self.extract_bike_name_from_link(link)
                     
-                    bike_info = {
+                    bikes_by_base_url[base_url] = {
                         'name': bike_name or 'Unknown Bike',
                         'url': href,
-                        'base_url': self.get_base_bike_url(href),  # For deduplication
+                        'base_url': base_url,
                         'brand': 'Canyon'
                     }
-                    
-                    all_bike_links.append(bike_info)
             
-            self.logger.info(f"Found {len(all_bike_links)} total bike links")
+            self.logger.info(f"Found {bike_link_count} total bike links")
             
-            # Remove duplicates by base URL (ignore color variants)
-            unique_bikes = []
-            seen_base_urls = set()
-            
-            for bike in all_bike_links:
-                base_url = bike['base_url']
-                if base_url not in seen_base_urls:
-                    unique_bikes.append(bike)
-                    seen_base_urls.add(base_url)
-                else:
-                    self.logger.debug(f"Skipping duplicate: {base_url}")
+            unique_bikes = list(bikes_by_base_url.values())
+            self.logger.debug(f"Skipped {bike_link_count - len(unique_bikes)} duplicate bike links")
             
             self.logger.info(f"Found {len(unique_bikes)} unique bikes to process")
             
-            # Process each individual bike
-            detailed_bikes = []
-            
-            for i, bike_info in enumerate(unique_bikes, 1):
-                bike_name = bike_info.get('name', 'Unknown')
-                self.logger.info(f"Processing bike {i}/{len(unique_bikes)}: {bike_name}")
-                
-                # Extract detailed specifications and data
-                detailed_bike = self.extract_bike_details(bike_info)
-                
-                if detailed_bike:
-                    detailed_bikes.append(detailed_bike)
-                    self.logger.info(f"Successfully processed {bike_name}")
-                else:
-                    self.logger.warning(f"Failed to process {bike_name}")
-                
-                # Add delay between requests
-                time.sleep(1)
+            # Process several bikes at once; results keep the listing order
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self.process_bike, bike_info, i, len(unique_bikes)) for i, bike_info in enumerate(unique_bikes, 1)]
+                detailed_bikes = [bike for bike in (future.result() for future in futures) if bike]
             
             self.logger.info(f"Successfully processed {len(detailed_bikes)} Canyon bikes")
             
-            # Remove duplicates by name while preserving order
-            final_bikes = []
-            seen_names = set()
-            
+            # Remove duplicates by name while preserving order; unnamed bikes are dropped
+            bikes_by_name = {}
             for bike in detailed_bikes:
                 bike_name = bike.get('name', '')
-                if bike_name and bike_name not in seen_names:
-                    final_bikes.append(bike)
-                    seen_names.add(bike_name)
+                if bike_name:
+                    bikes_by_name.setdefault(bike_name, bike)
+            final_bikes = list(bikes_by_name.values())
             
             self.logger.info(f"Successfully scraped {len(final_bikes)} unique Canyon bike models")
             
@@ -2013,36 +2173,12 @@ class CanyonBikeScraper:
         if '/racefietsen/' not in url:
             return False
         
-        # Must have a product ID (number before .html)
-        url_parts = base_url.rstrip('.html').split('/')
-        if url_parts and url_parts[-1].isdigit():
-            product_id = url_parts[-1]
-            # Product IDs are typically 4-5 digits
-            if len(product_id) >= 4:
-                pass  # Valid product ID
-            else:
-                return False
-        else:
+        # Must have a product ID (number before .html); product IDs are typically 4-5 digits
+        if not _PRODUCT_ID_RE.search(base_url):
             return False
         
         # Exclude blog content and promotional pages
-        excluded_patterns = [
-            '/blog-content/',
-            '/koopgids-',
-            '/wielren-blog',
-            '/news/',
-            '/stories/',
-            '/campaign/',
-            '/promo/',
-            '/service/',
-            '/support/'
-        ]
-        
-        for pattern in excluded_patterns:
-            if pattern in url:
-                return False
-        
-        return True
+        return not _EXCLUDED_BIKE_URL_RE.search(url)
 
     def extract_bike_name_from_link(self, link):
         """Extract bike name from link element"""
@@ -2062,7 +2198,7 @@ class CanyonBikeScraper:
                     return text
             
             # Look for elements with bike/product name classes
-            name_elements = parent.find_all(class_=lambda x: x and any(keyword in str(x).lower() for keyword in ['title', 'name', 'product']))
+            name_elements = parent.find_all(class_=_NAME_CLASS_RE)
             for elem in name_elements:
                 text = elem.get_text(strip=True)
                 if text and len(text) > 3:
@@ -2097,13 +2233,20 @@ class CanyonBikeScraper:
             ('data/Canyon/canyon_bikes_*.json', 'data/archive/Canyon'),
             ('data/Canyon/canyon_bikes_*.csv', 'data/archive/Canyon'), 
             ('data/Canyon/canyon_bikes_*.xlsx', 'data/archive/Canyon'),
+            ('data/Canyon/canyon_bikes_*.parquet', 'data/archive/Canyon'),
             ('data/wordpress_imports/canyon_bikes_wordpress_*.csv', 'data/archive/wordpress_imports')
         ]
         
         files_archived = 0
         
         for pattern, archive_dir in patterns_and_archive_dirs:
-            files = glob.glob(pattern)
+            # List the folder once and take each match's mtime from the scandir entry
+            directory, name_pattern = os.path.split(pattern)
+            try:
+                with os.scandir(directory) as entries:
+                    files = [(entry.path, entry.stat().st_mtime) for entry in entries if fnmatch.fnmatch(entry.name, name_pattern)]
+            except FileNotFoundError:
+                continue
             # All files in brand and wordpress folders are timestamped (no 'latest' files there)
             timestamped_files = files
             
@@ -2112,12 +2255,11 @@ class CanyonBikeScraper:
                 os.makedirs(archive_dir, exist_ok=True)
                 
                 # Sort by modification time, newest first
-                timestamped_files.sort(key=os.path.getmtime, reverse=True)
+                timestamped_files.sort(key=lambda file_entry: file_entry[1], reverse=True)
                 
                 # Move older files to archive
-                for old_file in timestamped_files[keep_count:]:
+                for old_file, _ in timestamped_files[keep_count:]:
                     try:
-                        import shutil
                         filename = os.path.basename(old_file)
                         archive_path = os.path.join(archive_dir, filename)
                         
@@ -2137,6 +2279,8 @@ class CanyonBikeScraper:
 
     def save_data(self, bikes, timestamp=None):
         """Save scraped data to JSON, CSV, and Excel files"""
+        import pandas as pd
+        
         if not timestamp:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -2152,14 +2296,16 @@ class CanyonBikeScraper:
         json_file = f'{brand_dir}/canyon_bikes_{timestamp}.json'
         csv_file = f'{brand_dir}/canyon_bikes_{timestamp}.csv'
         excel_file = f'{brand_dir}/canyon_bikes_{timestamp}.xlsx'
+        parquet_file = f'{brand_dir}/canyon_bikes_{timestamp}.parquet'
         
         # Save JSON
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(bikes, f, ensure_ascii=False, indent=2)
+        with open(json_file, 'wb') as f:
+            f.write(json_dumps(bikes))
         self.logger.info(f"Saved {len(bikes)} bikes to {json_file}")
         
         # Prepare data for CSV/Excel
         csv_data = []
+        parquet_saved = False
         for bike in bikes:
             # Get color variants
             colors = bike.get('colors', [])
@@ -2168,6 +2314,29 @@ class CanyonBikeScraper:
             if not colors:
                 colors = [{'id': '', 'name': '', 'url': ''}]
             
+            # The specification and image columns are the same for every color variant,
+            # so build them once per bike
+            specifications = bike.get('specifications', {})
+            
+            # Add all required specification columns in the specified order
+            bike_columns = {f'spec_{spec_name}': specifications.get(spec_name, '') for spec_name in _CSV_SPEC_COLUMNS}
+            
+            # Also add the legacy Material and Weight specs for compatibility
+            bike_columns['spec_Material'] = specifications.get('Material', '')
+            bike_columns['spec_Weight'] = specifications.get('Weight', '')
+            
+            # Add hero images
+            hero_images = bike.get('hero_images', [])
+            if hero_images:
+                for i, img_info in enumerate(hero_images):
+                    if isinstance(img_info, dict):
+                        bike_columns[f'hero_image_{i+1}_url'] = img_info.get('url', '')
+                        bike_columns[f'hero_image_{i+1}_path'] = img_info.get('local_path', '')
+                        bike_columns[f'hero_image_{i+1}_filename'] = img_info.get('filename', '')
+                    else:
+                        # Handle case where it's just a URL string
+                        bike_columns[f'hero_image_{i+1}_url'] = str(img_info)
+            
             # Create a separate row for each color variant
             for color in colors:
                 row = {
@@ -2179,72 +2348,63 @@ class CanyonBikeScraper:
                     'sku': bike.get('sku', ''),
                     'variant': color.get('id', ''),  # Color ID as variant
                     'color': color.get('name', ''),  # Color name as color
-                    'description': bike.get('description', '')
+                    'description': bike.get('description', ''),
+                    **bike_columns
                 }
                 
-                # Add specific Dutch specification columns
-                specifications = bike.get('specifications', {})
-                
-                # Add all required specification columns in the specified order
-                required_spec_columns = [
-                    'Frame', 'Framefit', 'Gewicht', 'Gewichtslimiet', 'Shifter', 
-                    'Voorderailleur', 'Achterderailleur', 'Crankstel', 'Bottom_bracket', 
-                    'Cassette', 'Ketting', 'Pedaal', 'Maximale_maat_kettingblad',
-                    'Naaf_voor', 'As_voorwiel', 'Naaf_achter', 'Velg', 'Buitenband',
-                    'Maximale_bandenmaat', 'Zadel', 'Zadelpen', 'Stuur', 'Stuurlint',
-                    'Stuurpen', 'Balhoofdstel', 'Rem', 'Shifter_speed'
-                ]
-                
-                # Add each specification column
-                for spec_name in required_spec_columns:
-                    row[f'spec_{spec_name}'] = specifications.get(spec_name, '')
-                
-                # Also add the legacy Material and Weight specs for compatibility
-                row['spec_Material'] = specifications.get('Material', '')
-                row['spec_Weight'] = specifications.get('Weight', '')
-                
-                # Add hero images
-                hero_images = bike.get('hero_images', [])
-                if hero_images:
-                    for i, img_info in enumerate(hero_images):
-                        if isinstance(img_info, dict):
-                            row[f'hero_image_{i+1}_url'] = img_info.get('url', '')
-                            row[f'hero_image_{i+1}_path'] = img_info.get('local_path', '')
-                            row[f'hero_image_{i+1}_filename'] = img_info.get('filename', '')
-                        else:
-                            # Handle case where it's just a URL string
-                            row[f'hero_image_{i+1}_url'] = str(img_info)
-                
                 csv_data.append(row)
         
         # Save CSV
         if csv_data:
-            df = pd.DataFrame(csv_data)
-            df.to_csv(csv_file, index=False, encoding='utf-8', quoting=1)  # QUOTE_ALL for proper CSV format
+            # Columns in order of first appearance, like the DataFrame built for Excel below
+            fieldnames = list(dict.fromkeys(key for row in csv_data for key in row))
+            with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL, lineterminator=os.linesep)
+                writer.writeheader()
+                writer.writerows(csv_data)
             self.logger.info(f"Saved {len(bikes)} bikes to {csv_file}")
             
             # Save Excel
-            df.to_excel(excel_file, index=False, engine='openpyxl')
+            df = pd.DataFrame(csv_data)
+            df.to_excel(excel_file, index=False, engine=EXCEL_ENGINE)
             self.logger.info(f"Saved {len(bikes)} bikes to {excel_file}")
-        
-        # Also save latest versions (overwrite)
+            
+            # Save Parquet; price mixes floats with '' and raw price text, so it is stored
+            # as text exactly like in the CSV (where a missing price is empty, not 'None').
+            # The export is optional, so a column pyarrow can't convert only costs a warning
+            if PARQUET_AVAILABLE:
+                try:
+                    prices = df['price'].map(lambda price: '' if price is None else str(price))
+                    df.assign(price=prices).to_parquet(parquet_file, compression='snappy', index=False)
+                    parquet_saved = True
+                    self.logger.info(f"Saved {len(bikes)} bikes to {parquet_file}")
+                except Exception as e:
+                    self.logger.warning(f"Could not save Parquet export {parquet_file}: {e}")
+        
+        # Also save latest versions (overwrite); copying the files avoids encoding everything twice,
+        # and unlike hard links the copies stay independent of the archived originals
         latest_json = 'data/canyon_bikes_latest.json'
         latest_csv = 'data/canyon_bikes_latest.csv'
         latest_excel = 'data/canyon_bikes_latest.xlsx'
+        latest_parquet = 'data/canyon_bikes_latest.parquet'
         
-        with open(latest_json, 'w', encoding='utf-8') as f:
-            json.dump(bikes, f, ensure_ascii=False, indent=2)
+        shutil.copyfile(json_file, latest_json)
         
         if csv_data:
-            df.to_csv(latest_csv, index=False, encoding='utf-8', quoting=1)  # QUOTE_ALL for proper CSV format
-            df.to_excel(latest_excel, index=False, engine='openpyxl')
+            shutil.copyfile(csv_file, latest_csv)
+            shutil.copyfile(excel_file, latest_excel)
+            if parquet_saved:
+                shutil.copyfile(parquet_file, latest_parquet)
         
         self.logger.info(f"Also saved latest versions as {latest_json}, {latest_csv}, and {latest_excel}")
         
         # Automatically generate WordPress-ready CSV for Canyon
-        if WORDPRESS_CONVERTER_AVAILABLE and csv_data:
+        if not self.generate_wordpress:
+            self.logger.info("Skipping WordPress CSV generation")
+        elif WORDPRESS_CONVERTER_AVAILABLE and csv_data:
             try:
                 self.logger.info("Generating WordPress-ready CSV...")
+                from wordpress_csv_converter import convert_latest_to_wordpress
                 wp_file = convert_latest_to_wordpress(brand="canyon", verbose=False)
                 if wp_file:
                     self.logger.info(f"WordPress CSV generated: {wp_file}")
@@ -2287,46 +2447,46 @@ class CanyonBikeScraper:
         print(f"\n🚴 Trek Bikes Scraping Summary 🚴")
         print("=" * 50)
         
-        # Count unique models and total variants
-        unique_models = len(set(bike.get('name', '') for bike in bikes))
-        total_variants = len(bikes)
-        
-        print(f"Total unique models: {unique_models}")
-        print(f"Total color variants: {total_variants}")
-        
-        # Count models with multiple colors
-        name_counts = {}
-        for bike in bikes:
-            name = bike.get('name', '')
-            if name:
-                name_counts[name] = name_counts.get(name, 0) + 1
-        
-        multi_color_models = sum(1 for count in name_counts.values() if count > 1)
-        print(f"Models with multiple colors: {multi_color_models}")
-        
-        # Price range
-        prices = []
+        # Gather names, categories, colors and prices in a single pass over the bikes
+        name_counts = Counter()
+        categories = Counter()
+        color_counts = Counter()
+        price_bikes = []
         for bike in bikes:
+            name_counts[bike.get('name', '')] += 1
+            categories[bike.get('category', 'Unknown')] += 1
+            color = bike.get('color', '')
+            if color:
+                color_counts[color] += 1
+            
             price_str = str(bike.get('price', ''))
             if price_str and price_str != 'None':
                 # Extract numeric price
-                price_match = re.search(r'[\d,]+', price_str.replace('€', '').replace('.', ''))
+                price_match = _SUMMARY_PRICE_RE.search(price_str.replace('€', '').replace('.', ''))
                 if price_match:
                     try:
                         price = int(price_match.group().replace(',', ''))
-                        prices.append(price)
+                        price_bikes.append((bike.get('name', ''), bike.get('variant', ''), price))
                     except ValueError:
                         pass
+        prices = [price for _, _, price in price_bikes]
         
+        # Count unique models and total variants
+        unique_models = len(name_counts)
+        total_variants = len(bikes)
+        
+        print(f"Total unique models: {unique_models}")
+        print(f"Total color variants: {total_variants}")
+        
+        # Count models with multiple colors (unnamed bikes are not a model)
+        multi_color_models = sum(1 for name, count in name_counts.items() if name and count > 1)
+        print(f"Models with multiple colors: {multi_color_models}")
+        
+        # Price range
         if prices:
             print(f"Price range: €{min(prices)} - €{max(prices)}")
         
         # Category breakdown
-        categories = {}
-        for bike in bikes:
-            category = bike.get('category', 'Unknown')
-            categories[category] = categories.get(category, 0) + 1
-        
         print(f"\nCategories:")
         for category, count in sorted(categories.items()):
             print(f"  {category}: {count} models")
@@ -2350,32 +2510,13 @@ class CanyonBikeScraper:
                 print(f"  ... and {len(models_with_multiple_colors) - 5} more models with multiple colors")
         
         # Show all unique colors
-        all_colors = set()
-        for bike in bikes:
-            color = bike.get('color', '')
-            if color:
-                all_colors.add(color)
-        
-        print(f"\n🎨 All Available Colors ({len(all_colors)}):")
-        for color in sorted(all_colors):
-            count = sum(1 for bike in bikes if bike.get('color') == color)
+        print(f"\n🎨 All Available Colors ({len(color_counts)}):")
+        for color, count in sorted(color_counts.items()):
             print(f"  {color}: {count} bikes")
         
         # Show most expensive bikes
         if prices:
             print(f"\nTop 5 most expensive bikes:")
-            price_bikes = []
-            for bike in bikes:
-                price_str = str(bike.get('price', ''))
-                if price_str and price_str != 'None':
-                    price_match = re.search(r'[\d,]+', price_str.replace('€', '').replace('.', ''))
-                    if price_match:
-                        try:
-                            price = int(price_match.group().replace(',', ''))
-                            price_bikes.append((bike.get('name', ''), bike.get('variant', ''), price))
-                        except ValueError:
-                            pass
-            
             price_bikes.sort(key=lambda x: x[2], reverse=True)
             for i, (name, variant, price) in enumerate(price_bikes[:5], 1):
                 variant_str = f" ({variant})" if variant else ""
@@ -2471,47 +2612,15 @@ class CanyonBikeScraper:
             
             self.logger.info(f"Fetching onderdelen from: {dynamic_url}")
             
-            # Fetch the dynamic content
+            # Fetch the dynamic content (covered by the bike's token taken in process_bike)
             response = self.session.get(dynamic_url, timeout=15)
             response.raise_for_status()
             
-            onderdelen_soup = BeautifulSoup(response.content, 'html.parser')
+            onderdelen_soup = self.parse_response(response, parse_only=_ONDERDELEN_STRAINER)
             
             # Extract component specifications
             specs = {}
             
-            # Component mapping from Canyon names to our spec fields
-            component_mapping = {
-                # Drivetrain (Aandrijving)
-                'voorderailleur': 'Voorderailleur', 'front derailleur': 'Voorderailleur',
-                'achterderailleur': 'Achterderailleur', 'rear derailleur': 'Achterderailleur',
-                'derailleur': 'Achterderailleur',  # Default to rear if not specified
-                'crankstel': 'Crankstel', 'crankset': 'Crankstel', 'crank': 'Crankstel',
-                'bottom bracket': 'Bottom_bracket', 'trapas': 'Bottom_bracket',
-                'cassette': 'Cassette', 'tandwielcassette': 'Cassette',
-                'chain': 'Ketting', 'ketting': 'Ketting',
-                'pedaal': 'Pedaal', 'pedal': 'Pedaal', 'pedalen': 'Pedaal',
-                'kettingblad': 'Maximale_maat_kettingblad', 'chainring': 'Maximale_maat_kettingblad',
-                
-                # Wheels (Wielen)
-                'front hub': 'Naaf_voor', 'voornaaf': 'Naaf_voor', 'naaf voor': 'Naaf_voor',
-                'front axle': 'As_voorwiel', 'vooras': 'As_voorwiel', 'as voorwiel': 'As_voorwiel',
-                'rear hub': 'Naaf_achter', 'achternaaf': 'Naaf_achter', 'naaf achter': 'Naaf_achter',
-                'rim': 'Velg', 'velg': 'Velg', 'velgen': 'Velg',
-                'tire': 'Buitenband', 'tyre': 'Buitenband', 'band': 'Buitenband', 'buitenband': 'Buitenband',
-                
-                # Cockpit
-                'saddle': 'Zadel', 'zadel': 'Zadel', 'zitting': 'Zadel',
-                'seatpost': 'Zadelpen', 'zadelpen': 'Zadelpen', 'zadelstam': 'Zadelpen',
-                'handlebar': 'Stuur', 'stuur': 'Stuur', 'handlebars': 'Stuur',
-                'bar tape': 'Stuurlint', 'stuurlint': 'Stuurlint', 'tape': 'Stuurlint',
-                'stem': 'Stuurpen', 'stuurpen': 'Stuurpen', 'voorstam': 'Stuurpen',
-                'headset': 'Balhoofdstel', 'balhoofdstel': 'Balhoofdstel',
-                
-                # Brakes (Remmen) - excluding shifters for now
-                'brake': 'Rem', 'rem': 'Rem', 'remmen': 'Rem', 'brakes': 'Rem'
-            }
-            
             # Use proper HTML structure to find components
             # Look for component sections with titles and their corresponding component names
             
@@ -2543,8 +2652,7 @@ class CanyonBikeScraper:
                             for feature in features:
                                 if 'materiaal:' in feature.lower():
                                     # Extract material after "Materiaal:"
-                                    import re
-                                    match = re.search(r'materiaal:\s*([^.]+)', feature, re.IGNORECASE)
+                                    match = _FRAME_MATERIAL_FEATURE_RE.search(feature)
                                     if match:
                                         material = match.group(1).strip()
                                         break
@@ -2552,66 +2660,8 @@ class CanyonBikeScraper:
                         else:
                             component_description = component_name
                         
-                        # Map component titles to our specification fields
-                        title_to_field = {
-                            'schakel / remhendel': 'Shifter',
-                            'voorderailleur': 'Voorderailleur', 
-                            'achterderailleur': 'Achterderailleur',
-                            'crankstel': 'Crankstel',
-                            'trapas': 'Bottom_bracket',
-                            'bottom bracket': 'Bottom_bracket',
-                            'cassette': 'Cassette',
-                            'ketting': 'Ketting',
-                            'chain': 'Ketting',
-                            'pedaal': 'Pedaal',
-                            'pedalen': 'Pedaal',
-                            'kettingblad': 'Maximale_maat_kettingblad',
-                            'chainring': 'Maximale_maat_kettingblad',
-                            'wiel': 'Wiel',  # We'll handle wheel components specially
-                            'wheel': 'Wiel',
-                            'steekas': 'Steekas',  # We'll handle axle components specially
-                            'through axle': 'Steekas',
-                            'voornaaf': 'Naaf_voor',
-                            'naaf voor': 'Naaf_voor', 
-                            'front hub': 'Naaf_voor',
-                            'vooras': 'As_voorwiel',
-                            'as voorwiel': 'As_voorwiel',
-                            'front axle': 'As_voorwiel',
-                            'achternaaf': 'Naaf_achter',
-                            'naaf achter': 'Naaf_achter',
-                            'rear hub': 'Naaf_achter',
-                            'velg': 'Velg',
-                            'velgen': 'Velg',
-                            'rim': 'Velg',
-                            'band': 'Buitenband',
-                            'buitenband': 'Buitenband',
-                            'tire': 'Buitenband',
-                            'tyre': 'Buitenband',
-                            'zadel': 'Zadel',
-                            'saddle': 'Zadel',
-                            'zadelpen': 'Zadelpen',
-                            'seatpost': 'Zadelpen',
-                            'stuur': 'Stuur',
-                            'cockpit': 'Stuur',
-                            'handlebar': 'Stuur',
-                            'handlebars': 'Stuur',
-                            'stuurlint': 'Stuurlint',
-                            'bar tape': 'Stuurlint',
-                            'tape': 'Stuurlint',
-                            'stuurpen': 'Stuurpen',
-                            'stem': 'Stuurpen',
-                            'balhoofdstel': 'Balhoofdstel',
-                            'headset': 'Balhoofdstel',
-                            'rem': 'Rem',
-                            'remmen': 'Rem',
-                            'brake': 'Rem',
-                            'brakes': 'Rem',
-                            'frame': 'Frame',
-                            'kader': 'Frame'
-                        }
-                        
                         # Check if this component title matches any of our fields
-                        for title_pattern, spec_field in title_to_field.items():
+                        for title_pattern, spec_field in _ONDERDELEN_TITLE_TO_FIELD.items():
                             if title_pattern in component_title:
                                 # Special handling for frame material - store in both Frame and Material
                                 if component_title.lower() == 'frame' and component_description:
@@ -2622,11 +2672,9 @@ class CanyonBikeScraper:
                                 # Special handling for shifter - prefer the most complete one and clean up speed info
                                 elif spec_field == 'Shifter':
                                     # Remove speed information from shifter names
-                                    import re
-                                    cleaned_name = re.sub(r',\s*\d+[-\s]*speed\b', '', component_description, flags=re.IGNORECASE)
-                                    cleaned_name = re.sub(r',\s*\d+s\b', '', cleaned_name, flags=re.IGNORECASE)
-                                    cleaned_name = re.sub(r'\b\d+[-\s]*speed\b', '', cleaned_name, flags=re.IGNORECASE)
-                                    cleaned_name = re.sub(r'\b\d+s\b', '', cleaned_name, flags=re.IGNORECASE)
+                                    cleaned_name = component_description
+                                    for pattern in _ONDERDELEN_SHIFTER_SPEED_PATTERNS:
+                                        cleaned_name = pattern.sub('', cleaned_name)
                                     cleaned_name = cleaned_name.strip().rstrip(',').strip()
                                     
                                     if spec_field not in specs or len(cleaned_name) > len(specs[spec_field]):
@@ -2637,7 +2685,6 @@ class CanyonBikeScraper:
                                     if spec_field not in specs:
                                         specs[spec_field] = component_description
                                     # Extract chainring info from crankset features
-                                    import re
                                     for feature in features:
                                         if 'aantal tandwielen' in feature.lower() or 'chainrings' in feature.lower():
                                             specs['Maximale_maat_kettingblad'] = feature
@@ -2646,7 +2693,6 @@ class CanyonBikeScraper:
                                 # Special handling for wheels - extract hub and rim info
                                 elif spec_field == 'Wiel':
                                     # Determine if this is front or rear wheel based on axle size
-                                    import re
                                     is_front_wheel = False
                                     is_rear_wheel = False
                                     
@@ -2676,7 +2722,6 @@ class CanyonBikeScraper:
                                 # Special handling for through axles
                                 elif spec_field == 'Steekas':
                                     # Determine if this is front or rear axle
-                                    import re
                                     for feature in features:
                                         if '12x100' in feature:
                                             if 'As_voorwiel' not in specs:
@@ -2702,18 +2747,10 @@ class CanyonBikeScraper:
                                 break
             
             # Also look for speed count (gear count) in the text
-            import re
-            speed_patterns = [
-                r'(\d+)[-\s]*speed',
-                r'(\d+)[-\s]*versnellingen',
-                r'(\d+)[-\s]*Speed'
-            ]
-            
-            # Get all text from the onderdelen page for speed matching
-            onderdelen_text = onderdelen_soup.get_text().lower()
+            onderdelen_text = onderdelen_soup.get_text()
             
-            for pattern in speed_patterns:
-                matches = re.findall(pattern, onderdelen_text)
+            for pattern in _SPEED_COUNT_PATTERNS:
+                matches = pattern.findall(onderdelen_text)
                 if matches and 'Shifter_speed' not in specs:
                     speeds = [int(m) for m in matches if m.isdigit()]
                     if speeds:
@@ -2722,21 +2759,6 @@ class CanyonBikeScraper:
                             specs['Shifter_speed'] = f"{max_speed} speed"
                             break
             
-            # Look for specific component categories
-            category_headers = onderdelen_soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            current_category = None
-            
-            for header in category_headers:
-                header_text = header.get_text(strip=True).lower()
-                if 'aandrijving' in header_text:
-                    current_category = 'drivetrain'
-                elif 'remmen' in header_text:
-                    current_category = 'brakes'
-                elif 'wielen' in header_text:
-                    current_category = 'wheels'
-                elif 'cockpit' in header_text:
-                    current_category = 'cockpit'
-            
             self.logger.info(f"Extracted {len(specs)} component specifications from onderdelen")
             return specs
             
@@ -2800,8 +2822,7 @@ class CanyonBikeScraper:
                 text_content = classification_text.get_text()
                 
                 # Extract weight limit using regex
-                import re
-                kg_match = re.search(r'(\d+)\s*kg', text_content)
+                kg_match = _WEIGHT_LIMIT_KG_RE.search(text_content)
                 if kg_match:
                     weight_limit = kg_match.group(1)
                     return f"{weight_limit} kg"
@@ -2816,7 +2837,15 @@ class CanyonBikeScraper:
 
 def main():
     """Main function"""
-    scraper = CanyonBikeScraper()
+    parser = argparse.ArgumentParser(description="Scrape Canyon road bikes")
+    parser.add_argument('--cache', action='store_true', help="cache HTTP responses on disk for a day (requires requests-cache)")
+    parser.add_argument('--workers', type=int, default=4, help="number of bike pages fetched concurrently (default: 4)")
+    parser.add_argument('--skip-wordpress', action='store_true', help="don't generate the WordPress CSV after saving")
+    args = parser.parse_args()
+    
+    scraper = CanyonBikeScraper(use_cache=args.cache)
+    scraper.max_workers = max(1, args.workers)
+    scraper.generate_wordpress = not args.skip_wordpress
     
     # Scrape bikes
     bikes = scraper.scrape_canyon_bikes()
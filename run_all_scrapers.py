@@ -7,14 +7,24 @@ Runs all bike scrapers and automatically updates master databases with discontin
 import subprocess
 import sys
 import os
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from master_database_manager import MasterDatabaseManager
 
+# Import WordPress converter
+try:
+    from wordpress_csv_converter import convert_latest_to_wordpress
+    WORDPRESS_CONVERTER_AVAILABLE = True
+except ImportError:
+    WORDPRESS_CONVERTER_AVAILABLE = False
+
 def run_scraper(scraper_name):
     """Run a specific scraper and return success status"""
     print(f"🚀 Running {scraper_name}...")
     try:
-        result = subprocess.run([sys.executable, scraper_name], 
+        # The WordPress conversion is done afterwards in main(), one brand at a time
+        result = subprocess.run([sys.executable, scraper_name, '--skip-wordpress'], 
                               capture_output=True, text=True, timeout=3600)
         
         if result.returncode == 0:
@@ -48,27 +58,64 @@ def main():
     successful_scrapers = []
     failed_scrapers = []
     
-    # Run each scraper
+    available_scrapers = []
     for scraper in scrapers:
         if os.path.exists(scraper):
-            print(f"📍 Step 1: Running {scraper}")
-            print("-" * 40)
-            
-            success = run_scraper(scraper)
-            
-            if success:
-                successful_scrapers.append(scraper)
-            else:
-                failed_scrapers.append(scraper)
-            
-            print()
+            available_scrapers.append(scraper)
         else:
             print(f"⚠️  Scraper not found: {scraper}")
             failed_scrapers.append(scraper)
     
+    # Run the scrapers in parallel - each one targets a different website, runs in its
+    # own process and writes its own brand's files. The WordPress conversion is the
+    # exception: its cleanup archives both brands' files in data/wordpress_imports, so
+    # the scrapers skip it and it runs sequentially below
+    if available_scrapers:
+        print(f"📍 Step 1: Running {', '.join(available_scrapers)}")
+        print("-" * 40)
+        
+        scrapers_started = time.time()
+        
+        with ThreadPoolExecutor(max_workers=len(available_scrapers)) as executor:
+            results = executor.map(run_scraper, available_scrapers)
+            
+            for scraper, success in zip(available_scrapers, results):
+                if success:
+                    successful_scrapers.append(scraper)
+                else:
+                    failed_scrapers.append(scraper)
+        
+        print()
+    
+    # Generate the WordPress CSVs one brand at a time
+    if successful_scrapers and WORDPRESS_CONVERTER_AVAILABLE:
+        print("📍 Step 2: Generating WordPress CSVs")
+        print("-" * 40)
+        
+        for scraper in successful_scrapers:
+            brand = scraper.split('_')[0]
+            
+            # A scraper that found no bikes exits cleanly without saving, so only convert
+            # latest CSVs written during this run
+            latest_csv = f"data/{brand}_bikes_latest.csv"
+            if not os.path.exists(latest_csv) or os.path.getmtime(latest_csv) < scrapers_started:
+                print(f"⚠️  No new {brand.capitalize()} data - skipping WordPress CSV")
+                continue
+            
+            wp_file = convert_latest_to_wordpress(brand=brand, verbose=False)
+            if wp_file:
+                print(f"✅ {brand.capitalize()} WordPress CSV: {wp_file}")
+            else:
+                print(f"❌ {brand.capitalize()} WordPress CSV generation failed")
+        
+        print()
+    elif successful_scrapers:
+        print("⚠️  WordPress converter not available (wordpress_csv_converter.py not found)")
+        print()
+    
     # Update master databases if any scrapers succeeded
     if successful_scrapers:
-        print("📍 Step 2: Updating Master Databases")
+        print("📍 Step 3: Updating Master Databases")
         print("-" * 40)
         
         try:
@@ -5,19 +5,24 @@ Scrapes Trek road bikes from the Dutch website with intelligent predictions
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 import json
 import csv
 import pandas as pd
 import re
 import logging
-from datetime import datetime
+import argparse
+from datetime import datetime, timedelta
 import time
+import threading
 import os
 import shutil
 from urllib.parse import urljoin, urlparse
 import glob
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Import WordPress converter
 try:
@@ -26,17 +31,257 @@ try:
 except ImportError:
     WORDPRESS_CONVERTER_AVAILABLE = False
 
+# Optional on-disk HTTP cache for repeated development runs
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Prefer the C-based lxml parser, fall back to the built-in parser if it is missing
+try:
+    BeautifulSoup('', 'lxml')
+    HTML_PARSER = 'lxml'
+except FeatureNotFound:
+    HTML_PARSER = 'html.parser'
+
+# The listing page is only mined for dataLayer JSON, so only build the script
+# tags (Trek also uses non-standard <script2> tags for its dataLayer pushes)
+LISTING_PAGE_STRAINER = SoupStrainer(re.compile(r'^script'))
+
+# Patterns and selectors used for every scraped page, compiled once at import time
+_IMPRESSIONS_RE = re.compile(r'"impressions"\s*:\s*(\[.*?\])', re.DOTALL)
+_ECOMMERCE_ITEMS_RE = re.compile(r'ecommerce["\']?\s*:\s*{[^}]*items["\']?\s*:\s*(\[.*?\])', re.DOTALL)
+_COLOR_ARRAY_RE = re.compile(r'"name"\s*:\s*"([^"]+)".*?"color"\s*:\s*\[\s*((?:"[^"]*"(?:\s*,\s*)?)+)\s*\]', re.DOTALL)
+_COLOR_ENTITY_ARRAY_RE = re.compile(r'"name"\s*:\s*"([^"]+)".*?&#034;color&#034;\s*:\s*\[\s*((?:&#034;[^&]*&#034;(?:\s*,\s*)?)+)\s*\]', re.DOTALL)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_ENTITY_QUOTED_RE = re.compile(r'&#034;([^&]*)&#034;')
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_FORK_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'carbon voorvork[^.]*',
+    r'voorvork[^.]*carbon[^.]*',
+    r'fork[^.]*carbon[^.]*',
+    r'carbon fork[^.]*'
+])
+
+_BOTTOM_BRACKET_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'((?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*?(?:T47|BSA|PressFit)[^.]*)',
+    r'((?:T47|BSA|PressFit)[^.]*?(?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*)',
+    r'(Bottom bracket[^.]*(?:SRAM|Praxis|Shimano)[^.]*)',
+    r'((?:SRAM|Praxis|Shimano)[^.]*bottom bracket[^.]*)'
+])
+
+_CHAIN_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'((?:SRAM|Shimano|KMC)\s+(?:PC-\d+|HG\d+|CN\d+|XT M\d+|Ultegra|105)[^.]*?(?:\d+-)?\d+-speed)',
+    r'((?:SRAM|Shimano|KMC)\s+[^.]*?(?:\d+-)?\d+-speed[^.]*chain)',
+    r'(chain[^.]*(?:SRAM|Shimano|KMC)[^.]*(?:\d+-)?\d+-speed)',
+    r'((?:\d+-)?\d+-speed[^.]*(?:SRAM|Shimano|KMC)[^.]*chain)'
+])
+
+# Weight limits like "125 kg", "150 kg", etc.
+_WEIGHT_LIMIT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(\d+(?:[.,]\d+)?\s*kg)',
+    r'(\d+(?:[.,]\d+)?\s*lbs?)',
+])
+
+# Matches "8.43 kg / 18.59 lbs" and captures just "8.43 kg"
+_KG_RE = re.compile(r'(\d+(?:[.,]\d+)?\s*kg)(?:\s*/\s*\d+(?:[.,]\d+)?\s*lbs)?', re.IGNORECASE)
+_KG_LBS_RE = re.compile(r'\d+(?:[.,]\d+)?\s*kg\s*/\s*\d+(?:[.,]\d+)?\s*lbs', re.IGNORECASE)
+
+# Numeric frame sizes without cm (like "56 -" but not "56 cm -", "ML -" or "M -")
+_NUMERIC_SIZE_WEIGHT_RE = re.compile(r'(\d+)\s*-\s*(\d+(?:[.,]\d+)?\s*kg)')
+
+# Frame size information at the start of a shifter spec
+_SHIFTER_SIZE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'^Maat:\s*(?:\d+(?:\s*,\s*\d+)*)\s+',  # Numeric sizes
+    r'^Maat:\s*(?:[A-Z]+(?:\s*,\s*[A-Z]+)*)\s+',  # Letter sizes (XS, S, M, ML, L, XL)
+])
+
+_SHIFTER_SPEED_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(\d+)\s*speed',           # "8 speed", "10 Speed"
+    r'(\d+)-speed',             # "9-speed", "11-speed"
+    r'(\d+)\s*versnellingen',   # "10 versnellingen"
+])
+
+_SHIFTER_SPEED_REMOVAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r',?\s*\d+\s*speed\s*,?',           # ", 8 speed,", "10 Speed"
+    r',?\s*\d+-speed\s*,?',             # ", 9-speed,", "11-speed"
+    r',?\s*\d+\s*versnellingen\s*,?',   # ", 10 versnellingen,"
+])
+_DOUBLE_COMMA_RE = re.compile(r',\s*,')
+
+_FRAME_MATERIAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    # OCLV Carbon patterns
+    r'(\d+\s+[Ss]eries\s+OCLV\s+Carbon)',
+    r'(OCLV\s+Carbon\s+\d+)',
+    r'(OCLV\s+Carbon)',
+    # Alpha Aluminium patterns
+    r'(Ultralicht\s+\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
+    r'(\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
+    r'(Alpha\s+Aluminium\s+\d+)',
+    r'(Alpha\s+Aluminium)',
+    # Other materials
+    r'(Carbon\s+fiber)',
+    r'(Steel)',
+    r'(Titanium)',
+    r'(Chromoly)',
+])
+_FRAME_PREFIX_RE = re.compile(r'^(Frame[:\s]*)', re.IGNORECASE)
+
+_TEETH_RANGE_RE = re.compile(r'(\d+)-(\d+)')
+
+# Double chainring patterns like "50/34", "52/36", "48/35", "46x30"
+_DOUBLE_CHAINRING_PATTERNS = (
+    re.compile(r'\d+/\d+', re.IGNORECASE),   # "50/34" pattern
+    re.compile(r'\d+x\d+', re.IGNORECASE),   # "46x30" pattern (Trek uses this format!)
+)
+# The same patterns for is_2x_system, which matches them case-sensitively ("46X30" is not 2x there)
+_TWO_X_CHAINRING_PATTERNS = (
+    re.compile(r'\d+/\d+'),   # "50/34" pattern
+    re.compile(r'\d+x\d+'),   # "46x30" pattern (Trek uses this format!)
+)
+
+_SINGLE_CHAINRING_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\b40t\b.*ring',           # "40T ring"
+    r'\b42t\b.*ring',           # "42T ring"
+    r'\b40t\b.*kettingblad',    # "40T kettingblad"
+    r'\b42t\b.*kettingblad',    # "42T kettingblad"
+    r'narrow-wide.*kettingblad', # "narrow-wide kettingblad"
+    r'apex 1',                  # "SRAM Apex 1"
+    r'force.*1',                # "SRAM Force 1"
+    r'single.*chainring',       # "single chainring"
+])
+_CHAINRING_TEETH_RE = re.compile(r'\b(\d+)t\b', re.IGNORECASE)
+
+# Wide range cassettes typical of 1x systems
+_WIDE_RANGE_CASSETTE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'10-50', r'10-52', r'11-50', r'11-52',  # Very wide ranges
+    r'10-44', r'10-46', r'11-44', r'11-46',  # Wide ranges
+    r'10-48', r'11-48',                      # Common 1x ranges
+    r'10-42', r'11-42',                      # Moderate 1x ranges
+])
+
+# 1x-specific rear derailleurs
+_ONEX_REAR_DERAILLEUR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'apex 1',              # "SRAM Apex 1"
+    r'apex.*xplr',          # "SRAM Apex XPLR"
+    r'force.*xplr',         # "SRAM Force XPLR"
+    r'red.*xplr',           # "SRAM RED XPLR"
+    r'rival.*xplr',         # "SRAM Rival XPLR"
+    r'grx.*1x',             # "Shimano GRX 1x"
+    r'cues.*gs',            # "Shimano CUES GS" (often 1x)
+])
+
+# Gravel and some fitness bikes often use 1x
+_ONEX_CATEGORY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    'checkpoint.*alr.*[345]',   # Checkpoint ALR 3, 4, 5 often 1x
+    'fx.*sport',                # FX Sport bikes often 1x
+    'checkmate',                # Checkmate is typically 1x
+    'boone.*5',                 # Boone 5 often 1x
+])
+
+_DESCRIPTION_SELECTORS = (
+    'div[data-testid="product-positioning-statement"]',
+    '.product-positioning-statement',
+    '.product-description',
+    '.product-summary',
+    'div.product-details p',
+    'div.product-info p'
+)
+
+# Comprehensive patterns to find all carousel images
+_HERO_IMAGE_PATTERNS = tuple(re.compile(pattern, re.DOTALL) for pattern in [
+    # Enhanced structured data patterns
+    r'"heroCarousel"\s*:\s*\[([^\]]+)\]',
+    r'"productImages"\s*:\s*\[([^\]]+)\]',
+    r'"imageGallery"\s*:\s*\[([^\]]+)\]',
+    r'"gallery"\s*:\s*\[([^\]]+)\]',
+    r'"images"\s*:\s*\[([^\]]+)\]',
+    r'"slides"\s*:\s*\[([^\]]+)\]',
+    r'"carouselSlides"\s*:\s*\[([^\]]+)\]',
+
+    # Color variant specific patterns
+    r'"colorSwatchImageUrl"\s*:\s*\[([^\]]+)\]',
+    r'"variantImages"\s*:\s*\[([^\]]+)\]',
+    r'"colorVariants"\s*:\s*\[([^\]]+)\]',
+
+    # Individual image patterns
+    r'"heroImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"primaryImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"firstVariantImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"thumbnailImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+
+    # URL patterns with various prefixes
+    r'"[a-zA-Z_]*[Uu]rl"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+    r'"[a-zA-Z_]*[Ii]mage[a-zA-Z_]*"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
+
+    # Enhanced alternative image arrays
+    r'"primaryImages"\s*:\s*\[([^\]]+)\]',
+    r'"galleryImages"\s*:\s*\[([^\]]+)\]',
+    r'"productGallery"\s*:\s*\[([^\]]+)\]',
+    r'"heroImages"\s*:\s*\[([^\]]+)\]',
+])
+_QUOTED_TREK_MEDIA_URL_RE = re.compile(r'"([^"]*media\.trekbikes\.com[^"]*)"')
+_TREK_MEDIA_URL_RE = re.compile(r'([^"]*media\.trekbikes\.com[^"]*)')
+_UPLOAD_TRANSFORM_RE = re.compile(r'/image/upload/[^/]+/')
+
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-_\.]')
+_UNSAFE_FOLDER_CHARS_RE = re.compile(r'[^\w\-_\s]')
+_PRICE_DIGITS_RE = re.compile(r'[\d,]+')
+
+class RateLimiter:
+    """Token bucket shared by the worker threads: allows bursts of `burst` requests
+    and `rate` requests per second on average"""
+    def __init__(self, rate, burst):
+        self.interval = 1.0 / rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping only when the bucket is empty"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+            self.updated = now
+            # Reserve the token now so waiting threads queue up in order
+            self.tokens -= 1
+            wait = -self.tokens * self.interval
+        if wait > 0:
+            time.sleep(wait)
+
 class TrekBikeScraper:
-    def __init__(self):
+    def __init__(self, use_cache=False):
         self.base_url = "https://www.trekbikes.com"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'nl-NL,nl;q=0.9,en;q=0.8',
         }
-        self.session = requests.Session()
+        if use_cache and REQUESTS_CACHE_AVAILABLE:
+            # Serve repeat GETs from a local SQLite cache for a day
+            self.session = requests_cache.CachedSession(
+                'trek_http_cache',
+                backend='sqlite',
+                expire_after=timedelta(days=1),
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update(self.headers)
         
+        # Keep connections to Trek alive across requests and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -48,11 +293,23 @@ class TrekBikeScraper:
         )
         self.logger = logging.getLogger(__name__)
         
+        if use_cache and not REQUESTS_CACHE_AVAILABLE:
+            self.logger.warning("requests-cache is not installed - running without HTTP cache")
+        
         # Image download settings
         self.download_images = True  # Set to False to disable image downloading
         self.images_base_dir = "images"
         self.max_image_size_mb = 10  # Skip images larger than this
         self.supported_formats = ['.jpg', '.jpeg', '.png', '.webp']
+        
+        # Number of bikes whose detail pages are fetched concurrently; all workers share
+        # one request budget, the old sequential pace of two detail pages per second
+        self.max_workers = 4
+        self.rate_limiter = RateLimiter(rate=2, burst=1)
+        
+        # Generate the WordPress CSV after saving (run_all_scrapers.py turns this off and
+        # converts once every scraper has finished)
+        self.generate_wordpress = True
 
     def format_color_name(self, variant):
         """Format color variant name for better readability"""
@@ -99,12 +356,12 @@ class TrekBikeScraper:
         html_content = str(soup)
         
         # Look for impressions array in the raw content
-        impressions_match = re.search(r'"impressions"\s*:\s*(\[.*?\])', html_content, re.DOTALL)
+        impressions_match = _IMPRESSIONS_RE.search(html_content)
         if impressions_match:
             try:
                 impressions_json = impressions_match.group(1)
                 # Clean up the JSON - remove extra whitespace and ensure proper formatting
-                impressions_json = re.sub(r'\s+', ' ', impressions_json)
+                impressions_json = _WHITESPACE_RE.sub(' ', impressions_json)
                 impressions_json = impressions_json.strip()
                 
                 impressions = json.loads(impressions_json)
@@ -139,7 +396,7 @@ class TrekBikeScraper:
                     script_content = script.string
                     
                     # Look for ecommerce items array
-                    ecommerce_match = re.search(r'ecommerce["\']?\s*:\s*{[^}]*items["\']?\s*:\s*(\[.*?\])', script_content, re.DOTALL)
+                    ecommerce_match = _ECOMMERCE_ITEMS_RE.search(script_content)
                     if ecommerce_match:
                         try:
                             items_json = ecommerce_match.group(1)
@@ -177,41 +434,57 @@ class TrekBikeScraper:
                 script_content = script.string
                 
                 # Pattern 1: Direct color array in JavaScript
-                color_pattern = r'"name"\s*:\s*"([^"]+)".*?"color"\s*:\s*\[\s*((?:"[^"]*"(?:\s*,\s*)?)+)\s*\]'
-                matches = re.findall(color_pattern, script_content, re.DOTALL)
+                matches = _COLOR_ARRAY_RE.findall(script_content)
                 
                 for bike_name, colors_str in matches:
-                    colors = re.findall(r'"([^"]+)"', colors_str)
+                    colors = _QUOTED_RE.findall(colors_str)
                     if colors:
                         color_variants[bike_name] = colors
                         self.logger.info(f"Found {len(colors)} color variants for {bike_name}: {colors}")
                 
                 # Pattern 2: HTML entity encoded colors
-                entity_pattern = r'"name"\s*:\s*"([^"]+)".*?&#034;color&#034;\s*:\s*\[\s*((?:&#034;[^&]*&#034;(?:\s*,\s*)?)+)\s*\]'
-                entity_matches = re.findall(entity_pattern, script_content, re.DOTALL)
+                entity_matches = _COLOR_ENTITY_ARRAY_RE.findall(script_content)
                 
                 for bike_name, colors_str in entity_matches:
-                    colors = re.findall(r'&#034;([^&]*)&#034;', colors_str)
+                    colors = _ENTITY_QUOTED_RE.findall(colors_str)
                     if colors:
                         color_variants[bike_name] = colors
                         self.logger.info(f"Found {len(colors)} color variants for {bike_name}: {colors}")
         
         return color_variants
 
-    def extract_specifications(self, bike_info):
+    def parse_response(self, response, parse_only=None):
+        """Parse an HTML response into a BeautifulSoup tree"""
+        # Don't spend a full parse on PDFs, images or other non-HTML responses
+        content_type = response.headers.get('Content-Type', '')
+        if content_type and 'html' not in content_type.lower():
+            raise ValueError(f"Expected an HTML page but got '{content_type}' from {response.url}")
+        
+        # Reuse the charset the server declared so BeautifulSoup can skip encoding detection.
+        # Without one, requests falls back to ISO-8859-1 for text/html, so let bs4 sniff instead.
+        from_encoding = None
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            from_encoding = response.encoding
+        
+        return BeautifulSoup(response.content, HTML_PARSER, from_encoding=from_encoding, parse_only=parse_only)
+
+    def fetch_detail_page(self, bike_info):
+        """Fetch and parse a bike detail page"""
+        detail_url = urljoin(self.base_url, bike_info['url'])
+        response = self.session.get(detail_url, timeout=10)
+        response.raise_for_status()
+        return self.parse_response(response)
+
+    def extract_specifications(self, bike_info, soup=None):
         """Extract detailed specifications from bike detail page"""
         if not bike_info.get('url'):
             return {}
-            
-        detail_url = urljoin(self.base_url, bike_info['url'])
         
         try:
-            response = self.session.get(detail_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if soup is None:
+                soup = self.fetch_detail_page(bike_info)
             
             specifications = {}
-            import re
             
             # Extract specifications from tables
             spec_tables = soup.find_all('table')
@@ -227,8 +500,8 @@ class TrekBikeScraper:
                         if not key:
                             # Extract text from HTML, removing tags but keeping content
                             key_html = str(cells[0])
-                            key = re.sub(r'<[^>]+>', ' ', key_html).strip()
-                            key = re.sub(r'\s+', ' ', key).strip()
+                            key = _TAG_RE.sub(' ', key_html).strip()
+                            key = _WHITESPACE_RE.sub(' ', key).strip()
                         
                         value = cells[1].get_text(strip=True) 
                         if not value:
@@ -237,9 +510,9 @@ class TrekBikeScraper:
                             # Extract text from HTML, removing tags but keeping content
                             value_html = str(cells[1])
                             # Remove HTML tags but keep the text content
-                            value = re.sub(r'<[^>]+>', ' ', value_html).strip()
+                            value = _TAG_RE.sub(' ', value_html).strip()
                             # Clean up extra whitespace
-                            value = re.sub(r'\s+', ' ', value).strip()
+                            value = _WHITESPACE_RE.sub(' ', value).strip()
                         
                         # Clean up the key - remove common prefixes and suffixes
                         if key.startswith('*'):
@@ -345,15 +618,8 @@ class TrekBikeScraper:
         content_text = soup.get_text().lower()
         
         # Look for fork-related information
-        fork_patterns = [
-            r'carbon voorvork[^.]*',
-            r'voorvork[^.]*carbon[^.]*',
-            r'fork[^.]*carbon[^.]*',
-            r'carbon fork[^.]*'
-        ]
-        
-        for pattern in fork_patterns:
-            matches = re.findall(pattern, content_text, re.IGNORECASE)
+        for pattern in _FORK_PATTERNS:
+            matches = pattern.findall(content_text)
             if matches:
                 # Return the first meaningful match, cleaned up
                 fork_info = matches[0].strip()
@@ -367,15 +633,8 @@ class TrekBikeScraper:
         content_text = soup.get_text()
         
         # Look for bottom bracket patterns
-        bb_patterns = [
-            r'((?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*?(?:T47|BSA|PressFit)[^.]*)',
-            r'((?:T47|BSA|PressFit)[^.]*?(?:SRAM DUB|Praxis|Shimano RS\d+)[^.]*)',
-            r'(Bottom bracket[^.]*(?:SRAM|Praxis|Shimano)[^.]*)',
-            r'((?:SRAM|Praxis|Shimano)[^.]*bottom bracket[^.]*)'
-        ]
-        
-        for pattern in bb_patterns:
-            matches = re.findall(pattern, content_text, re.IGNORECASE)
+        for pattern in _BOTTOM_BRACKET_PATTERNS:
+            matches = pattern.findall(content_text)
             if matches:
                 bb_info = matches[0].strip()
                 if len(bb_info) > 5:  # Only return if it's substantial
@@ -388,15 +647,8 @@ class TrekBikeScraper:
         content_text = soup.get_text()
         
         # Look for chain patterns
-        chain_patterns = [
-            r'((?:SRAM|Shimano|KMC)\s+(?:PC-\d+|HG\d+|CN\d+|XT M\d+|Ultegra|105)[^.]*?(?:\d+-)?\d+-speed)',
-            r'((?:SRAM|Shimano|KMC)\s+[^.]*?(?:\d+-)?\d+-speed[^.]*chain)',
-            r'(chain[^.]*(?:SRAM|Shimano|KMC)[^.]*(?:\d+-)?\d+-speed)',
-            r'((?:\d+-)?\d+-speed[^.]*(?:SRAM|Shimano|KMC)[^.]*chain)'
-        ]
-        
-        for pattern in chain_patterns:
-            matches = re.findall(pattern, content_text, re.IGNORECASE)
+        for pattern in _CHAIN_PATTERNS:
+            matches = pattern.findall(content_text)
             if matches:
                 chain_info = matches[0].strip()
                 if len(chain_info) > 5:  # Only return if it's substantial
@@ -413,16 +665,8 @@ class TrekBikeScraper:
         weight_limit_spec = str(weight_limit_spec).strip()
         
         # Look for weight patterns in the text
-        import re
-        
-        # Pattern to match weight limits like "125 kg", "150 kg", etc.
-        weight_patterns = [
-            r'(\d+(?:[.,]\d+)?\s*kg)',
-            r'(\d+(?:[.,]\d+)?\s*lbs?)',
-        ]
-        
-        for pattern in weight_patterns:
-            match = re.search(pattern, weight_limit_spec, re.IGNORECASE)
+        for pattern in _WEIGHT_LIMIT_PATTERNS:
+            match = pattern.search(weight_limit_spec)
             if match:
                 return match.group(1)
         
@@ -438,22 +682,14 @@ class TrekBikeScraper:
         weight_spec = str(weight_spec).strip()
         
         # Look for patterns like "8.43 kg / 18.59 lbs" and keep only the kg part
-        import re
-        
-        # Pattern to match kg value followed by optional lbs part
-        # This will match things like "8.43 kg / 18.59 lbs" and extract just "8.43 kg"
-        kg_pattern = r'(\d+(?:[.,]\d+)?\s*kg)(?:\s*/\s*\d+(?:[.,]\d+)?\s*lbs)?'
-        
-        # Find all kg values and remove any lbs parts
-        matches = re.findall(kg_pattern, weight_spec, re.IGNORECASE)
+        matches = _KG_RE.findall(weight_spec)
         
         if matches:
             # Replace the original kg/lbs pattern with just the kg part
             cleaned_spec = weight_spec
             for match in matches:
                 # Find the full pattern (kg + lbs) and replace with just kg
-                full_pattern = r'\d+(?:[.,]\d+)?\s*kg\s*/\s*\d+(?:[.,]\d+)?\s*lbs'
-                cleaned_spec = re.sub(full_pattern, match, cleaned_spec, flags=re.IGNORECASE)
+                cleaned_spec = _KG_LBS_RE.sub(match, cleaned_spec)
             
             return cleaned_spec
         
@@ -468,12 +704,6 @@ class TrekBikeScraper:
         # Convert to string and clean up
         weight_spec = str(weight_spec).strip()
         
-        import re
-        
-        # Pattern to match numeric frame sizes without cm (like "56 -" but not "56 cm -")
-        # This will match patterns like "56 -" or "58 -" but not "56 cm -" or "ML -" or "M -"
-        numeric_size_pattern = r'(\d+)\s*-\s*(\d+(?:[.,]\d+)?\s*kg)'
-        
         # Check if there's already a cm in the string
         if 'cm' not in weight_spec:
             # Replace numeric sizes with cm added
@@ -482,7 +712,7 @@ class TrekBikeScraper:
                 weight_part = match.group(2)
                 return f"{size} cm - {weight_part}"
             
-            weight_spec = re.sub(numeric_size_pattern, add_cm, weight_spec)
+            weight_spec = _NUMERIC_SIZE_WEIGHT_RE.sub(add_cm, weight_spec)
         
         return weight_spec
 
@@ -494,20 +724,11 @@ class TrekBikeScraper:
         # Convert to string and clean up
         shifter_spec = str(shifter_spec).strip()
         
-        import re
-        
-        # Pattern to match frame size information at the beginning
-        # This will remove patterns like:
+        # Remove frame size information from the beginning, like:
         # - "Maat: 47, 50, 52, 54, 56, 58, 60, 62 "
         # - "Maat: XS, S, M, ML, L, XL "
-        size_patterns = [
-            r'^Maat:\s*(?:\d+(?:\s*,\s*\d+)*)\s+',  # Numeric sizes
-            r'^Maat:\s*(?:[A-Z]+(?:\s*,\s*[A-Z]+)*)\s+',  # Letter sizes (XS, S, M, ML, L, XL)
-        ]
-        
-        # Remove any size pattern from the beginning
-        for pattern in size_patterns:
-            cleaned_spec = re.sub(pattern, '', shifter_spec, flags=re.IGNORECASE)
+        for pattern in _SHIFTER_SIZE_PATTERNS:
+            cleaned_spec = pattern.sub('', shifter_spec)
             if cleaned_spec != shifter_spec:
                 # Pattern matched, use the cleaned version
                 shifter_spec = cleaned_spec
@@ -523,17 +744,9 @@ class TrekBikeScraper:
         # Convert to string and clean up
         shifter_spec = str(shifter_spec).strip()
         
-        import re
-        
-        # Patterns to match speed information
-        speed_patterns = [
-            r'(\d+)\s*speed',           # "8 speed", "10 Speed"
-            r'(\d+)-speed',             # "9-speed", "11-speed"
-            r'(\d+)\s*versnellingen',   # "10 versnellingen"
-        ]
-        
-        for pattern in speed_patterns:
-            match = re.search(pattern, shifter_spec, re.IGNORECASE)
+        # Match speed information
+        for pattern in _SHIFTER_SPEED_PATTERNS:
+            match = pattern.search(shifter_spec)
             if match:
                 return f"{match.group(1)}-speed"
         
@@ -560,21 +773,13 @@ class TrekBikeScraper:
         # Convert to string and clean up
         shifter_spec = str(shifter_spec).strip()
         
-        import re
-        
-        # Patterns to remove speed information
-        speed_patterns = [
-            r',?\s*\d+\s*speed\s*,?',           # ", 8 speed,", "10 Speed"
-            r',?\s*\d+-speed\s*,?',             # ", 9-speed,", "11-speed"
-            r',?\s*\d+\s*versnellingen\s*,?',   # ", 10 versnellingen,"
-        ]
-        
-        for pattern in speed_patterns:
-            shifter_spec = re.sub(pattern, '', shifter_spec, flags=re.IGNORECASE)
+        # Remove speed information
+        for pattern in _SHIFTER_SPEED_REMOVAL_PATTERNS:
+            shifter_spec = pattern.sub('', shifter_spec)
         
         # Clean up any double commas or spaces
-        shifter_spec = re.sub(r',\s*,', ',', shifter_spec)
-        shifter_spec = re.sub(r'\s+', ' ', shifter_spec)
+        shifter_spec = _DOUBLE_COMMA_RE.sub(',', shifter_spec)
+        shifter_spec = _WHITESPACE_RE.sub(' ', shifter_spec)
         shifter_spec = shifter_spec.strip(' ,')
         
         return shifter_spec
@@ -587,28 +792,9 @@ class TrekBikeScraper:
         # Convert to string and clean up
         frame_spec = str(frame_spec).strip()
         
-        # Common frame material patterns
-        patterns = [
-            # OCLV Carbon patterns
-            r'(\d+\s+[Ss]eries\s+OCLV\s+Carbon)',
-            r'(OCLV\s+Carbon\s+\d+)',
-            r'(OCLV\s+Carbon)',
-            # Alpha Aluminium patterns  
-            r'(Ultralicht\s+\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
-            r'(\d+\s+[Ss]eries\s+Alpha\s+Aluminium)',
-            r'(Alpha\s+Aluminium\s+\d+)',
-            r'(Alpha\s+Aluminium)',
-            # Other materials
-            r'(Carbon\s+fiber)',
-            r'(Steel)',
-            r'(Titanium)',
-            r'(Chromoly)',
-        ]
-        
         # Try each pattern
-        for pattern in patterns:
-            import re
-            match = re.search(pattern, frame_spec, re.IGNORECASE)
+        for pattern in _FRAME_MATERIAL_PATTERNS:
+            match = pattern.search(frame_spec)
             if match:
                 material = match.group(1)
                 # Capitalize properly
@@ -621,7 +807,7 @@ class TrekBikeScraper:
         first_part = frame_spec.split(',')[0].strip()
         if first_part and len(first_part) < 100:
             # Clean up common prefixes/suffixes
-            first_part = re.sub(r'^(Frame[:\s]*)', '', first_part, flags=re.IGNORECASE)
+            first_part = _FRAME_PREFIX_RE.sub('', first_part)
             first_part = first_part.strip()
             if first_part:
                 self.logger.info(f"Using first part as frame material: {first_part}")
@@ -764,7 +950,7 @@ class TrekBikeScraper:
         
         # Check for wide range cassettes (typical for 1x systems)
         elif self.is_wide_range_cassette(cassette):
-            cassette_range = re.search(r'(\d+)-(\d+)', cassette)
+            cassette_range = _TEETH_RANGE_RE.search(cassette)
             if cassette_range:
                 min_teeth = int(cassette_range.group(1))
                 max_teeth = int(cassette_range.group(2))
@@ -806,33 +992,17 @@ class TrekBikeScraper:
             return False
         
         # First, check for double chainring patterns (2x systems)
-        double_chainring_patterns = [
-            r'\d+/\d+',   # "50/34" pattern
-            r'\d+x\d+',   # "46x30" pattern (Trek uses this format!)
-        ]
-        
-        for pattern in double_chainring_patterns:
-            if re.search(pattern, crankstel, re.IGNORECASE):
+        for pattern in _DOUBLE_CHAINRING_PATTERNS:
+            if pattern.search(crankstel):
                 return False  # This is a 2x system, not 1x
         
         # Look for single chainring patterns
-        single_chainring_patterns = [
-            r'\b40t\b.*ring',           # "40T ring"
-            r'\b42t\b.*ring',           # "42T ring"
-            r'\b40t\b.*kettingblad',    # "40T kettingblad"
-            r'\b42t\b.*kettingblad',    # "42T kettingblad"
-            r'narrow-wide.*kettingblad', # "narrow-wide kettingblad"
-            r'apex 1',                  # "SRAM Apex 1"
-            r'force.*1',                # "SRAM Force 1"
-            r'single.*chainring',       # "single chainring"
-        ]
-        
-        for pattern in single_chainring_patterns:
-            if re.search(pattern, crankstel, re.IGNORECASE):
+        for pattern in _SINGLE_CHAINRING_PATTERNS:
+            if pattern.search(crankstel):
                 return True
         
         # Check for single number followed by T (like "40T")
-        single_chainring = re.search(r'\b(\d+)t\b', crankstel, re.IGNORECASE)
+        single_chainring = _CHAINRING_TEETH_RE.search(crankstel)
         if single_chainring:
             teeth = int(single_chainring.group(1))
             # Single chainrings are typically 38-46T for road/gravel
@@ -847,19 +1017,12 @@ class TrekBikeScraper:
             return False
         
         # Wide range cassette patterns for 1x systems
-        wide_range_patterns = [
-            r'10-50', r'10-52', r'11-50', r'11-52',  # Very wide ranges
-            r'10-44', r'10-46', r'11-44', r'11-46',  # Wide ranges
-            r'10-48', r'11-48',                      # Common 1x ranges
-            r'10-42', r'11-42',                      # Moderate 1x ranges
-        ]
-        
-        for pattern in wide_range_patterns:
-            if re.search(pattern, cassette, re.IGNORECASE):
+        for pattern in _WIDE_RANGE_CASSETTE_PATTERNS:
+            if pattern.search(cassette):
                 return True
         
         # Check for numerical range
-        cassette_range = re.search(r'(\d+)-(\d+)', cassette)
+        cassette_range = _TEETH_RANGE_RE.search(cassette)
         if cassette_range:
             min_teeth = int(cassette_range.group(1))
             max_teeth = int(cassette_range.group(2))
@@ -877,18 +1040,8 @@ class TrekBikeScraper:
             return False
         
         # 1x-specific rear derailleur patterns
-        onex_patterns = [
-            r'apex 1',              # "SRAM Apex 1"
-            r'apex.*xplr',          # "SRAM Apex XPLR"
-            r'force.*xplr',         # "SRAM Force XPLR"
-            r'red.*xplr',           # "SRAM RED XPLR"
-            r'rival.*xplr',         # "SRAM Rival XPLR"
-            r'grx.*1x',             # "Shimano GRX 1x"
-            r'cues.*gs',            # "Shimano CUES GS" (often 1x)
-        ]
-        
-        for pattern in onex_patterns:
-            if re.search(pattern, rear_derailleur, re.IGNORECASE):
+        for pattern in _ONEX_REAR_DERAILLEUR_PATTERNS:
+            if pattern.search(rear_derailleur):
                 return True
         
         return False
@@ -896,15 +1049,8 @@ class TrekBikeScraper:
     def is_1x_bike_category(self, bike_name):
         """Check if bike category typically uses 1x systems"""
         # Gravel and some fitness bikes often use 1x
-        onex_categories = [
-            'checkpoint.*alr.*[345]',   # Checkpoint ALR 3, 4, 5 often 1x
-            'fx.*sport',                # FX Sport bikes often 1x
-            'checkmate',                # Checkmate is typically 1x
-            'boone.*5',                 # Boone 5 often 1x
-        ]
-        
-        for pattern in onex_categories:
-            if re.search(pattern, bike_name, re.IGNORECASE):
+        for pattern in _ONEX_CATEGORY_PATTERNS:
+            if pattern.search(bike_name):
                 return True
         
         return False
@@ -942,40 +1088,23 @@ class TrekBikeScraper:
             return False
         
         # Look for double chainring patterns like "50/34", "52/36", "48/35", "46x30"
-        double_chainring_patterns = [
-            r'\d+/\d+',   # "50/34" pattern
-            r'\d+x\d+',   # "46x30" pattern (Trek uses this format!)
-        ]
-        
-        for pattern in double_chainring_patterns:
-            if re.search(pattern, crankstel):
+        for pattern in _TWO_X_CHAINRING_PATTERNS:
+            if pattern.search(crankstel):
                 return True
         
         return False
 
-    def extract_description(self, bike_info):
+    def extract_description(self, bike_info, soup=None):
         """Extract bike description from detail page"""
         if not bike_info.get('url'):
             return ""
-            
-        detail_url = urljoin(self.base_url, bike_info['url'])
         
         try:
-            response = self.session.get(detail_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if soup is None:
+                soup = self.fetch_detail_page(bike_info)
             
             # Look for description in various places
-            description_selectors = [
-                'div[data-testid="product-positioning-statement"]',
-                '.product-positioning-statement',
-                '.product-description',
-                '.product-summary',
-                'div.product-details p',
-                'div.product-info p'
-            ]
-            
-            for selector in description_selectors:
+            for selector in _DESCRIPTION_SELECTORS:
                 elements = soup.select(selector)
                 for element in elements:
                     text = element.get_text(strip=True)
@@ -991,17 +1120,14 @@ class TrekBikeScraper:
             self.logger.error(f"Error extracting description for {bike_info.get('name', 'Unknown')}: {e}")
             return ""
 
-    def extract_hero_carousel_images(self, bike_info):
+    def extract_hero_carousel_images(self, bike_info, soup=None):
         """Extract all hero carousel images from bike detail page including color variants"""
         if not bike_info.get('url'):
             return []
-            
-        detail_url = urljoin(self.base_url, bike_info['url'])
         
         try:
-            response = self.session.get(detail_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if soup is None:
+                soup = self.fetch_detail_page(bike_info)
             
             hero_images = []
             html_content = str(soup)
@@ -1010,45 +1136,12 @@ class TrekBikeScraper:
             import html as html_module
             decoded_content = html_module.unescape(html_content)
             
-            # Comprehensive patterns to find all carousel images
-            image_patterns = [
-                # Enhanced structured data patterns
-                r'"heroCarousel"\s*:\s*\[([^\]]+)\]',
-                r'"productImages"\s*:\s*\[([^\]]+)\]',
-                r'"imageGallery"\s*:\s*\[([^\]]+)\]',
-                r'"gallery"\s*:\s*\[([^\]]+)\]',
-                r'"images"\s*:\s*\[([^\]]+)\]',
-                r'"slides"\s*:\s*\[([^\]]+)\]',
-                r'"carouselSlides"\s*:\s*\[([^\]]+)\]',
-                
-                # Color variant specific patterns
-                r'"colorSwatchImageUrl"\s*:\s*\[([^\]]+)\]',
-                r'"variantImages"\s*:\s*\[([^\]]+)\]',
-                r'"colorVariants"\s*:\s*\[([^\]]+)\]',
-                
-                # Individual image patterns
-                r'"heroImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"primaryImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"firstVariantImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"thumbnailImage"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                
-                # URL patterns with various prefixes
-                r'"[a-zA-Z_]*[Uu]rl"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                r'"[a-zA-Z_]*[Ii]mage[a-zA-Z_]*"\s*:\s*"([^"]*media\.trekbikes\.com[^"]*)"',
-                
-                # Enhanced alternative image arrays
-                r'"primaryImages"\s*:\s*\[([^\]]+)\]',
-                r'"galleryImages"\s*:\s*\[([^\]]+)\]',
-                r'"productGallery"\s*:\s*\[([^\]]+)\]',
-                r'"heroImages"\s*:\s*\[([^\]]+)\]',
-            ]
-            
             # Process structured data patterns (arrays) - use decoded content
-            for pattern in image_patterns[:13]:  # First 13 are array patterns
-                matches = re.findall(pattern, decoded_content, re.DOTALL)
+            for pattern in _HERO_IMAGE_PATTERNS[:13]:  # First 13 are array patterns
+                matches = pattern.findall(decoded_content)
                 for match in matches:
                     # Extract all image URLs from the array content
-                    image_urls = re.findall(r'"([^"]*media\.trekbikes\.com[^"]*)"', match)
+                    image_urls = _QUOTED_TREK_MEDIA_URL_RE.findall(match)
                     for url in image_urls:
                         # Clean up malformed URLs that have color prefixes
                         if '=' in url and '//' in url:
@@ -1066,8 +1159,8 @@ class TrekBikeScraper:
                         hero_images.append(url)
             
             # Process individual image patterns - use decoded content
-            for pattern in image_patterns[13:16]:  # Individual image patterns
-                matches = re.findall(pattern, decoded_content)
+            for pattern in _HERO_IMAGE_PATTERNS[13:16]:  # Individual image patterns
+                matches = pattern.findall(decoded_content)
                 for match in matches:
                     # Clean up malformed URLs that have color prefixes
                     if '=' in match and '//' in match:
@@ -1085,8 +1178,8 @@ class TrekBikeScraper:
                     hero_images.append(match)
             
             # Process URL and image patterns with various prefixes - use decoded content
-            for pattern in image_patterns[16:18]:  # URL patterns
-                matches = re.findall(pattern, decoded_content)
+            for pattern in _HERO_IMAGE_PATTERNS[16:18]:  # URL patterns
+                matches = pattern.findall(decoded_content)
                 for match in matches:
                     if '=' in match and '//' in match:
                         match = match.split('=', 1)[-1]
@@ -1102,10 +1195,10 @@ class TrekBikeScraper:
                     hero_images.append(match)
             
             # Process alternative image arrays - use decoded content
-            for pattern in image_patterns[18:]:  # Alternative image arrays
-                matches = re.findall(pattern, decoded_content, re.DOTALL)
+            for pattern in _HERO_IMAGE_PATTERNS[18:]:  # Alternative image arrays
+                matches = pattern.findall(decoded_content)
                 for match in matches:
-                    image_urls = re.findall(r'"([^"]*media\.trekbikes\.com[^"]*)"', match)
+                    image_urls = _QUOTED_TREK_MEDIA_URL_RE.findall(match)
                     for url in image_urls:
                         # Clean up malformed URLs that have color prefixes
                         if '=' in url and '//' in url:
@@ -1122,7 +1215,7 @@ class TrekBikeScraper:
                         hero_images.append(url)
             
             # Also search for any high-quality Trek images in the page - use decoded content
-            all_trek_images = re.findall(r'([^"]*media\.trekbikes\.com[^"]*)', decoded_content)
+            all_trek_images = _TREK_MEDIA_URL_RE.findall(decoded_content)
             for img_url in all_trek_images:
                 # Clean up malformed URLs that have color prefixes
                 if '=' in img_url and '//' in img_url:
@@ -1170,19 +1263,12 @@ class TrekBikeScraper:
                 if is_high_quality or (is_medium_quality and len(quality_images) < 10):
                     quality_images.append(img_url)
             
-            # Remove duplicates while preserving order
-            unique_images = []
-            seen_urls = set()
-            seen_paths = set()  # Track image paths to avoid same image with different transformations
-            
+            # Remove duplicates while preserving order, keyed on the base image path
+            # to avoid the same image with different transformations
+            images_by_path = {}
             for img_url in quality_images:
-                # Extract the base image path to avoid duplicates with different sizes
-                base_path = re.sub(r'/image/upload/[^/]+/', '/image/upload/', img_url)
-                
-                if img_url not in seen_urls and base_path not in seen_paths:
-                    unique_images.append(img_url)
-                    seen_urls.add(img_url)
-                    seen_paths.add(base_path)
+                images_by_path.setdefault(_UPLOAD_TRANSFORM_RE.sub('/image/upload/', img_url), img_url)
+            unique_images = list(images_by_path.values())
             
             if unique_images:
                 self.logger.info(f"Found {len(unique_images)} hero carousel images for {bike_info.get('name', 'Unknown')}")
@@ -1221,10 +1307,21 @@ class TrekBikeScraper:
             # Ensure directory exists
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
             
-            # Save the image
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Save the image under a per-thread name first, so concurrent downloads of the
+            # same file never interleave and an interrupted download leaves no partial image
+            part_path = f"{save_path}.{threading.get_ident()}.part"
+            try:
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+            except BaseException:
+                # The stream broke off (timeout, reset, ...): drop the partial file
+                try:
+                    os.remove(part_path)
+                except FileNotFoundError:
+                    pass
+                raise
+            os.replace(part_path, save_path)
             
             file_size = os.path.getsize(save_path) / (1024 * 1024)
             self.logger.info(f"Downloaded image ({file_size:.1f}MB): {os.path.basename(save_path)}")
@@ -1256,7 +1353,7 @@ class TrekBikeScraper:
                 filename = 'image.jpg'
         
         # Clean up filename - remove special characters
-        filename = re.sub(r'[^\w\-_\.]', '_', filename)
+        filename = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
         
         return filename
 
@@ -1269,8 +1366,8 @@ class TrekBikeScraper:
         brand = bike_info.get('brand', 'Trek')
         
         # Clean bike name for folder structure
-        clean_bike_name = re.sub(r'[^\w\-_\s]', '', bike_name)
-        clean_bike_name = re.sub(r'\s+', '_', clean_bike_name.strip())
+        clean_bike_name = _UNSAFE_FOLDER_CHARS_RE.sub('', bike_name)
+        clean_bike_name = _WHITESPACE_RE.sub('_', clean_bike_name.strip())
         
         # Create brand folder path
         brand_folder = os.path.join(self.images_base_dir, brand)
@@ -1309,6 +1406,53 @@ class TrekBikeScraper:
         
         return downloaded_images
 
+    def process_bike(self, bike_info, index, total):
+        """Fetch specifications, description and hero images for a single bike"""
+        bike_name = bike_info.get('name', 'Unknown')
+        detail_url = urljoin(self.base_url, bike_info.get('url', ''))
+        
+        self.logger.info(f"Processing bike {index}/{total}: {bike_name}")
+        
+        # Fetch and parse the detail page once and share it between the extractors;
+        # wait for the shared request budget first
+        self.rate_limiter.acquire()
+        self.logger.info(f"Fetching detail page from: {detail_url}")
+        try:
+            soup = self.fetch_detail_page(bike_info)
+        except Exception as e:
+            self.logger.error(f"Error fetching detail page for {bike_name}: {e}")
+            soup = None
+        
+        if soup is not None:
+            # Extract specifications
+            specifications = self.extract_specifications(bike_info, soup)
+            
+            if specifications:
+                self.logger.info(f"Extracted {len(specifications)} specifications")
+                bike_info['specifications'] = specifications
+                self.logger.info(f"Added {len(specifications)} specifications for {bike_name}")
+            
+            # Extract description
+            description = self.extract_description(bike_info, soup)
+            if description:
+                word_count = len(description.split())
+                bike_info['description'] = description
+                self.logger.info(f"Added description ({word_count} words) for {bike_name}")
+            
+            # Extract and download hero carousel images
+            hero_images = self.extract_hero_carousel_images(bike_info, soup)
+            if hero_images:
+                # Download the images
+                downloaded_images = self.save_bike_images(bike_info, hero_images)
+                if downloaded_images:
+                    bike_info['hero_images'] = downloaded_images
+                    self.logger.info(f"Downloaded {len(downloaded_images)} hero carousel images for {bike_name}")
+            
+            # Free the detail page tree before the worker moves on to the next bike
+            soup.decompose()
+        
+        return bike_info
+
     def scrape_trek_bikes(self):
         """Main scraping method"""
         # Trek road bikes URL (Dutch site)
@@ -1320,7 +1464,7 @@ class TrekBikeScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.parse_response(response, parse_only=LISTING_PAGE_STRAINER)
             
             # Extract bikes from dataLayer
             bikes = self.extract_bikes_from_datalayer(soup)
@@ -1329,16 +1473,18 @@ class TrekBikeScraper:
             # Extract color variants
             color_variants = self.extract_color_variants(soup)
             
+            # The listing tree is no longer needed once the dataLayer has been mined
+            soup.decompose()
+            
             # Log color variant extraction results
             for method in ['pattern', 'entity', 'colorSwatchImageUrl', 'direct']:
                 count = len([k for k, v in color_variants.items() if v])
                 self.logger.info(f"Found {count} matches with {method} pattern")
             
             # Process detailed data
-            detailed_bikes = []
             total_color_variants = 0
             
-            for i, bike_info in enumerate(bikes, 1):
+            for bike_info in bikes:
                 bike_name = bike_info.get('name', 'Unknown')
                 
                 # Check for color variants
@@ -1346,52 +1492,20 @@ class TrekBikeScraper:
                     colors = color_variants[bike_name]
                     total_color_variants += len(colors)
                     self.logger.info(f"Found {len(colors)} color variants for {bike_name}: {colors}")
-                
-                self.logger.info(f"Processing bike {i}/{len(bikes)}: {bike_name}")
-                
-                # Extract specifications
-                self.logger.info(f"Fetching specifications from: {urljoin(self.base_url, bike_info.get('url', ''))}")
-                specifications = self.extract_specifications(bike_info)
-                
-                if specifications:
-                    self.logger.info(f"Extracted {len(specifications)} specifications")
-                    bike_info['specifications'] = specifications
-                    self.logger.info(f"Added {len(specifications)} specifications for {bike_name}")
-                
-                # Extract description
-                self.logger.info(f"Fetching description from: {urljoin(self.base_url, bike_info.get('url', ''))}")
-                description = self.extract_description(bike_info)
-                if description:
-                    word_count = len(description.split())
-                    bike_info['description'] = description
-                    self.logger.info(f"Added description ({word_count} words) for {bike_name}")
-                
-                # Extract and download hero carousel images
-                self.logger.info(f"Fetching hero carousel images from: {urljoin(self.base_url, bike_info.get('url', ''))}")
-                hero_images = self.extract_hero_carousel_images(bike_info)
-                if hero_images:
-                    # Download the images
-                    downloaded_images = self.save_bike_images(bike_info, hero_images)
-                    if downloaded_images:
-                        bike_info['hero_images'] = downloaded_images
-                        self.logger.info(f"Downloaded {len(downloaded_images)} hero carousel images for {bike_name}")
-                
-                detailed_bikes.append(bike_info)
-                
-                # Add delay between requests
-                time.sleep(0.5)
             
-            self.logger.info(f"Extracted detailed data for {len(detailed_bikes)} products")
+            # Remove duplicates while preserving order before fetching anything, so two
+            # workers never process the same model and write to the same image paths
+            bikes_by_name = {}
+            for bike in bikes:
+                bikes_by_name.setdefault(bike.get('name', ''), bike)
+            unique_bikes = list(bikes_by_name.values())
             
-            # Remove duplicates while preserving order
-            unique_bikes = []
-            seen_names = set()
+            # Fetch detail pages for several bikes at once; results keep the listing order
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self.process_bike, bike_info, i, len(unique_bikes)) for i, bike_info in enumerate(unique_bikes, 1)]
+                unique_bikes = [future.result() for future in futures]
             
-            for bike in detailed_bikes:
-                bike_name = bike.get('name', '')
-                if bike_name not in seen_names:
-                    unique_bikes.append(bike)
-                    seen_names.add(bike_name)
+            self.logger.info(f"Extracted detailed data for {len(unique_bikes)} products")
             
             self.logger.info(f"Successfully scraped {len(unique_bikes)} unique bike models with {total_color_variants} total color variants")
             
@@ -1519,17 +1633,19 @@ class TrekBikeScraper:
         latest_csv = 'data/trek_bikes_latest.csv'
         latest_excel = 'data/trek_bikes_latest.xlsx'
         
-        with open(latest_json, 'w', encoding='utf-8') as f:
-            json.dump(bikes, f, ensure_ascii=False, indent=2)
+        # Copy the files written above instead of serializing everything a second time
+        shutil.copyfile(json_file, latest_json)
         
         if csv_data:
-            df.to_csv(latest_csv, index=False, encoding='utf-8', quoting=1)  # QUOTE_ALL for proper CSV format
-            df.to_excel(latest_excel, index=False, engine='openpyxl')
+            shutil.copyfile(csv_file, latest_csv)
+            shutil.copyfile(excel_file, latest_excel)
         
         self.logger.info(f"Also saved latest versions as {latest_json}, {latest_csv}, and {latest_excel}")
         
         # Automatically generate WordPress-ready CSV
-        if WORDPRESS_CONVERTER_AVAILABLE and csv_data:
+        if not self.generate_wordpress:
+            self.logger.info("Skipping WordPress CSV generation")
+        elif WORDPRESS_CONVERTER_AVAILABLE and csv_data:
             try:
                 self.logger.info("Generating WordPress-ready CSV...")
                 wp_file = convert_latest_to_wordpress(verbose=False)
@@ -1582,37 +1698,31 @@ class TrekBikeScraper:
         print(f"Total color variants: {total_variants}")
         
         # Count models with multiple colors
-        name_counts = {}
-        for bike in bikes:
-            name = bike.get('name', '')
-            if name:
-                name_counts[name] = name_counts.get(name, 0) + 1
+        name_counts = Counter(bike.get('name', '') for bike in bikes if bike.get('name', ''))
         
         multi_color_models = sum(1 for count in name_counts.values() if count > 1)
         print(f"Models with multiple colors: {multi_color_models}")
         
-        # Price range
-        prices = []
+        # Parse every price once; used for the price range and the most expensive bikes
+        price_bikes = []
         for bike in bikes:
             price_str = bike.get('price', '')
             if price_str:
                 # Extract numeric price
-                price_match = re.search(r'[\d,]+', price_str.replace('€', '').replace('.', ''))
+                price_match = _PRICE_DIGITS_RE.search(price_str.replace('€', '').replace('.', ''))
                 if price_match:
                     try:
                         price = int(price_match.group().replace(',', ''))
-                        prices.append(price)
+                        price_bikes.append((bike.get('name', ''), bike.get('variant', ''), price))
                     except ValueError:
                         pass
         
-        if prices:
+        if price_bikes:
+            prices = [price for _, _, price in price_bikes]
             print(f"Price range: €{min(prices)} - €{max(prices)}")
         
         # Category breakdown
-        categories = {}
-        for bike in bikes:
-            category = bike.get('category', 'Unknown')
-            categories[category] = categories.get(category, 0) + 1
+        categories = Counter(bike.get('category', 'Unknown') for bike in bikes)
         
         print(f"\nCategories:")
         for category, count in sorted(categories.items()):
@@ -1637,32 +1747,15 @@ class TrekBikeScraper:
                 print(f"  ... and {len(models_with_multiple_colors) - 5} more models with multiple colors")
         
         # Show all unique colors
-        all_colors = set()
-        for bike in bikes:
-            color = bike.get('color', '')
-            if color:
-                all_colors.add(color)
+        color_counts = Counter(bike.get('color', '') for bike in bikes if bike.get('color', ''))
         
-        print(f"\n🎨 All Available Colors ({len(all_colors)}):")
-        for color in sorted(all_colors):
-            count = sum(1 for bike in bikes if bike.get('color') == color)
+        print(f"\n🎨 All Available Colors ({len(color_counts)}):")
+        for color, count in sorted(color_counts.items()):
             print(f"  {color}: {count} bikes")
         
         # Show most expensive bikes
-        if prices:
+        if price_bikes:
             print(f"\nTop 5 most expensive bikes:")
-            price_bikes = []
-            for bike in bikes:
-                price_str = bike.get('price', '')
-                if price_str:
-                    price_match = re.search(r'[\d,]+', price_str.replace('€', '').replace('.', ''))
-                    if price_match:
-                        try:
-                            price = int(price_match.group().replace(',', ''))
-                            price_bikes.append((bike.get('name', ''), bike.get('variant', ''), price))
-                        except ValueError:
-                            pass
-            
             price_bikes.sort(key=lambda x: x[2], reverse=True)
             for i, (name, variant, price) in enumerate(price_bikes[:5], 1):
                 variant_str = f" ({variant})" if variant else ""
@@ -1721,7 +1814,13 @@ class TrekBikeScraper:
 
 def main():
     """Main function"""
-    scraper = TrekBikeScraper()
+    parser = argparse.ArgumentParser(description="Scrape Trek road bikes")
+    parser.add_argument('--cache', action='store_true', help="cache HTTP responses on disk for a day (requires requests-cache)")
+    parser.add_argument('--skip-wordpress', action='store_true', help="don't generate the WordPress CSV after saving")
+    args = parser.parse_args()
+    
+    scraper = TrekBikeScraper(use_cache=args.cache)
+    scraper.generate_wordpress = not args.skip_wordpress
     
     # Scrape bikes
     bikes = scraper.scrape_trek_bikes()